@@ -5,11 +5,12 @@ Orchestrates query routing, LLM response generation, order context
 management, and system switching between orders, permits, and states.
 """
 
-import json
 import logging
 import re
 from typing import Any, Dict, Optional, Tuple
 
+import orjson
+
 from config.constants import (
     ORDER_SWITCH_KEYWORDS,
     PERMIT_SWITCH_KEYWORDS,
@@ -111,14 +112,18 @@ async def generate_response(
                 )
             )
 
-        # Build user message
+        # Build user message. The details are serialized compactly since any
+        # indentation would be collapsed by normalize_whitespace anyway.
+        details_json = orjson.dumps(
+            filtered_details, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
         user_message = normalize_whitespace(
             f"Query: {query}, "
             f"Order Selection: {order_cache.explanation}, "
             f"{open_close_orders}, "
             f"OpenOrdersCount: {open_count}, "
             f"Closed/Completed OrdersCount: {closed_count}, "
-            f"Available Order Details: {json.dumps(filtered_details, indent=2)}, "
+            f"Available Order Details: {details_json}, "
             "Provide a direct and short answer using only the information "
             "from the specified order. Put '.' at last if a sentence."
         )
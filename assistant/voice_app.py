@@ -8,6 +8,7 @@ wake word detection, system routing, and proactive notifications.
 import asyncio
 import logging
 from datetime import datetime
+from typing import Optional
 
 from assistant import handle_query
 from config.constants import PROACTIVE_STATUS_KEYWORDS
@@ -21,6 +22,7 @@ from services.location_weather import (
 from services.order_cache import OrderCache
 from services.proactive_monitor import ProactiveMonitor
 from services.speech_service import SpeechSynthesizer, take_command
+from services.state_service import ensure_state_name_index
 from services.user_service import VALID_ROLES, verify_email
 
 logger = logging.getLogger(__name__)
@@ -32,6 +34,7 @@ user_email: str = ""
 order_cache: OrderCache = OrderCache()
 speech_synthesizer: SpeechSynthesizer = None  # type: ignore
 proactive_monitor: ProactiveMonitor = None  # type: ignore
+state_index_task: Optional[asyncio.Task] = None
 
 
 async def initialize_user() -> None:
@@ -40,6 +43,7 @@ async def initialize_user() -> None:
 
     order_cache = OrderCache()
     speech_synthesizer = SpeechSynthesizer()
+    await speech_synthesizer.prewarm()
 
     # Get role via text input
     while True:
@@ -75,7 +79,7 @@ async def initialize_user() -> None:
             permit_warning_days=settings.proactive.permit_warning_days,
             deadline_warning_hours=settings.proactive.deadline_warning_hours,
         )
-        proactive_monitor.start()
+        await proactive_monitor.start()
         logger.info("Proactive monitoring enabled")
 
     await speech_synthesizer.text_to_speech(
@@ -119,8 +123,7 @@ async def process_command(query: str) -> None:
         print("Assistant:", farewell)
         await speech_synthesizer.text_to_speech(farewell)
         conversation_handler.save(query, farewell)
-        if proactive_monitor:
-            proactive_monitor.stop()
+        _stop_background_tasks()
         exit()
 
     # Proactive status check ("any updates?", "any alerts?", "what's new?")
@@ -132,7 +135,7 @@ async def process_command(query: str) -> None:
         phrase in query_lower
         for phrase in ("where am i", "my location", "current location")
     ):
-        location_info = get_location_string()
+        location_info = await get_location_string()
         print(location_info)
         await speech_synthesizer.text_to_speech(location_info)
         conversation_handler.save(query, location_info)
@@ -160,7 +163,7 @@ async def process_command(query: str) -> None:
         phrase in query_lower
         for phrase in ("weather", "temperature", "how hot", "how cold")
     ):
-        weather_info = get_weather()
+        weather_info = await get_weather()
         print(weather_info)
         await speech_synthesizer.text_to_speech(weather_info)
         conversation_handler.save(query, weather_info)
@@ -227,9 +230,25 @@ async def _deliver_proactive_alerts(force: bool = False) -> None:
         )
 
 
+async def _ensure_state_name_index() -> None:
+    """Run the one-time state name backfill without blocking startup."""
+    try:
+        await asyncio.to_thread(ensure_state_name_index)
+    except Exception as e:
+        logger.warning("Could not ensure state name index: %s", e)
+
+
+def _stop_background_tasks() -> None:
+    """Stop proactive monitoring and cancel the startup backfill if still running."""
+    if proactive_monitor:
+        proactive_monitor.stop()
+    if state_index_task and not state_index_task.done():
+        state_index_task.cancel()
+
+
 async def main() -> None:
     """Main voice assistant loop with wake word detection and proactive alerts."""
-    global speech_synthesizer
+    global speech_synthesizer, state_index_task
 
     # Configure logging
     logging.basicConfig(
@@ -239,6 +258,7 @@ async def main() -> None:
 
     speech_synthesizer = SpeechSynthesizer()
     conversation_handler.clear()
+    state_index_task = asyncio.create_task(_ensure_state_name_index())
     await initialize_user()
     await greet()
 
@@ -281,8 +301,7 @@ async def main() -> None:
 
         except KeyboardInterrupt:
             print("\nExiting...")
-            if proactive_monitor:
-                proactive_monitor.stop()
+            _stop_background_tasks()
             break
         except Exception as e:
             logger.error("Error in main loop: %s", e)
@@ -291,5 +310,15 @@ async def main() -> None:
             )
 
 
+def _use_uvloop() -> None:
+    """Run the event loop on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 if __name__ == "__main__":
+    _use_uvloop()
     asyncio.run(main())
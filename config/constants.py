@@ -228,3 +228,22 @@ PROACTIVE_STATUS_KEYWORDS: FrozenSet[str] = frozenset({
     "what did i miss", "anything i should know",
     "catch me up", "brief me",
 })
+
+
+# ─── Speech ──────────────────────────────────────────────────────────────────
+
+# Fixed phrases spoken by the assistant; kept decoded in memory for instant playback
+STATIC_TTS_PHRASES: Tuple[str, ...] = (
+    "Let me check that information for you.",
+    "Switching back to order system...",
+    "Switching back to order system",
+    "Switching to State Information System...",
+    "Switching to Permit System...",
+    "Switching to Orders...",
+    "Please mention a valid state name in your question.",
+    "State not found in database. Please try another state.",
+    "Please say the order ID",
+    "Invalid order ID.",
+    "Yes, how can I help you?",
+    "Goodbye!",
+)
@@ -21,6 +21,19 @@ class MongoSettings:
     uri: str = field(default_factory=lambda: os.getenv("MONGO_URI", ""))
     database: str = field(default_factory=lambda: os.getenv("MONGO_DATABASE", "HeavyHaulDB"))
 
+    # Connection pool and client options
+    max_pool_size: int = field(
+        default_factory=lambda: int(os.getenv("MONGO_MAX_POOL_SIZE", "20"))
+    )
+    min_pool_size: int = field(
+        default_factory=lambda: int(os.getenv("MONGO_MIN_POOL_SIZE", "2"))
+    )
+    server_selection_timeout_ms: int = 5000
+    read_preference: str = field(
+        default_factory=lambda: os.getenv("MONGO_READ_PREFERENCE", "primary")
+    )
+    compressors: str = field(default_factory=lambda: os.getenv("MONGO_COMPRESSORS", ""))
+
     # Collection names
     orders_collection: str = "All Orders"
     drivers_collection: str = "Drivers"
@@ -44,7 +57,13 @@ class LLMSettings:
     groq_model: str = "llama-3.3-70b-versatile"
     groq_fast_model: str = "llama-3.3-70b-specdec"
     deep_infra_model: str = "meta-llama/Llama-3.3-70B-Instruct-Turbo"
-    embedding_model: str = "text-embedding-ada-002"
+    embedding_model: str = field(
+        default_factory=lambda: os.getenv("EMBEDDING_MODEL", "text-embedding-ada-002")
+    )
+    # OpenAI-compatible embeddings endpoint; empty uses OpenAI itself
+    embedding_base_url: str = field(
+        default_factory=lambda: os.getenv("EMBEDDING_BASE_URL", "")
+    )
 
     # Generation parameters
     default_temperature: float = 0.3
@@ -60,6 +79,7 @@ class SpeechSettings:
         default_factory=lambda: os.getenv("TTS_VOICE", "en-US-ChristopherNeural")
     )
     audio_frequency: int = 24000
+    audio_buffer_size: int = 4096
     stream_audio_dir: str = "assets/stream_audios"
     recognizer_energy_threshold: int = 1000
     recognizer_pause_threshold: float = 1.0
@@ -76,6 +96,12 @@ class WeatherSettings:
     api_key: str = field(default_factory=lambda: os.getenv("WEATHER_API_KEY", ""))
     base_url: str = "http://api.openweathermap.org/data/2.5/weather"
     units: str = "metric"
+    ip_location_url: str = field(
+        default_factory=lambda: os.getenv("IP_LOCATION_URL", "https://ipapi.co/json/")
+    )
+    location_cache_ttl: int = field(
+        default_factory=lambda: int(os.getenv("LOCATION_CACHE_TTL", "600"))
+    )
 
 
 @dataclass(frozen=True)
@@ -111,6 +137,7 @@ class RAGSettings:
     chroma_db_directory: str = "data/chroma_db"
     chunk_size: int = 1000
     chunk_overlap: int = 200
+    max_concurrent_queries: int = 4
     provision_topics: tuple = (
         "Night Travel or night restrictions",
         "Oversize Operating Time",
@@ -34,7 +34,16 @@ class MongoDatabase:
     def _connect(self) -> None:
         """Establish MongoDB connection."""
         try:
-            self._client = MongoClient(settings.mongo.uri)
+            mongo = settings.mongo
+            options = {
+                "maxPoolSize": mongo.max_pool_size,
+                "minPoolSize": mongo.min_pool_size,
+                "serverSelectionTimeoutMS": mongo.server_selection_timeout_ms,
+                "readPreference": mongo.read_preference,
+            }
+            if mongo.compressors:
+                options["compressors"] = mongo.compressors
+            self._client = MongoClient(mongo.uri, **options)
             self._db: Database = self._client[settings.mongo.database]
             logger.info("Connected to MongoDB: %s", settings.mongo.database)
         except Exception as e:
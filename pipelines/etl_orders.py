@@ -5,13 +5,14 @@ Fetches order data from the external API, preprocesses it,
 and upserts into MongoDB collections (orders, drivers, clients, companies).
 """
 
+import io
 import logging
-import os
 import re
 from typing import Any, Dict, List, Optional
 
 import pdfplumber
 import requests
+from pymongo import UpdateOne
 
 from config.settings import settings
 from db import get_db
@@ -223,18 +224,14 @@ def extract_text_from_pdf(pdf_url: str) -> Optional[str]:
     Returns:
         Extracted text, or None on failure.
     """
-    temp_path = "temp_etl.pdf"
     try:
         response = requests.get(pdf_url, timeout=30)
         if response.status_code != 200:
             logger.error("Failed to download PDF: %s", pdf_url)
             return None
 
-        with open(temp_path, "wb") as f:
-            f.write(response.content)
-
         extracted_text = []
-        with pdfplumber.open(temp_path) as pdf:
+        with pdfplumber.open(io.BytesIO(response.content)) as pdf:
             for page in pdf.pages:
                 text = page.extract_text()
                 if text:
@@ -245,19 +242,19 @@ def extract_text_from_pdf(pdf_url: str) -> Optional[str]:
     except Exception as e:
         logger.error("Error extracting text from PDF %s: %s", pdf_url, e)
         return None
-    finally:
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
 
 
 def process_route_permits(order_data: Dict[str, Any]) -> None:
     """Process permit PDFs from route data and store extracted text.
 
+    Extracted text for all of the order's permits is written in a single
+    bulk request.
+
     Args:
         order_data: Order document with routeData.
     """
-    db = get_db()
     route_data = order_data.get("order", {}).get("routeData", [])
+    updates: List[UpdateOne] = []
 
     for route in route_data:
         state_id = route.get("id")
@@ -274,11 +271,16 @@ def process_route_permits(order_data: Dict[str, Any]) -> None:
                 logger.info("Processing permit PDF for %s: %s", state_name, url)
                 text = extract_text_from_pdf(url)
                 if text:
-                    db.orders.update_one(
-                        {"order.routeData.id": state_id},
-                        {"$set": {"order.routeData.$.permit_info": {"extracted_text": text}}},
+                    updates.append(
+                        UpdateOne(
+                            {"order.routeData.id": state_id},
+                            {"$set": {"order.routeData.$.permit_info": {"extracted_text": text}}},
+                        )
                     )
 
+    if updates:
+        get_db().orders.bulk_write(updates, ordered=False)
+
 
 def process_api_order(order_id: str) -> None:
     """Fetch, preprocess, and ingest a single order from the API.
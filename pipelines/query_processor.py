@@ -8,8 +8,10 @@ by state, date, and order status.
 
 import json
 import logging
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from config.constants import (
     LAST_N_MONTHS_KEYWORDS,
@@ -21,6 +23,7 @@ from config.constants import (
 from config.settings import settings
 from db import get_db
 from services.llm_client import get_llm
+from utils.text import normalize_whitespace
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +32,11 @@ KEY_EXTRACTION_PROMPT = """You are a very intelligent AI assistant who is expert
 Important Note: You just have to return the relevant keys to the user's query from the sample order schema nothing else.
 Return only comma-separated key names."""
 
+# Key extraction answers keyed by normalized question, least recently used first
+_KEYS_CACHE_SIZE = 1024
+_keys_cache: "OrderedDict[str, str]" = OrderedDict()
+_keys_cache_lock = threading.Lock()
+
 
 # ─── Data Fetchers ────────────────────────────────────────────────────────────
 
@@ -106,8 +114,49 @@ KEY_FUNCTIONS: Dict[str, Any] = {
 }
 
 
+# Status buckets used by build_status_index; other statuses keep their own name
+_STATUS_GROUPS = {"open": "open", "closed": "closed", "completed": "closed"}
+
+
 # ─── Filters ─────────────────────────────────────────────────────────────────
 
+def build_status_index(results: List[Dict]) -> Dict[str, List[Dict]]:
+    """Group results by order status in a single pass.
+
+    Open orders are keyed ``"open"`` and closed or completed orders
+    ``"closed"``; any other status is keyed by its lowercased value.
+    Rows keep their original relative order within each bucket.
+
+    Args:
+        results: Result rows, optionally carrying an ``order_status``.
+
+    Returns:
+        Mapping of status bucket to matching rows.
+    """
+    index: Dict[str, List[Dict]] = {}
+    for result in results:
+        if "order_status" in result:
+            index.setdefault(_status_bucket(result), []).append(result)
+    return index
+
+
+def _status_bucket(result: Dict) -> str:
+    """Return the ``build_status_index`` bucket for a row with a status."""
+    status = result["order_status"].lower()
+    return _STATUS_GROUPS.get(status, status)
+
+
+def _requested_statuses(query: str) -> Tuple[str, ...]:
+    """Return the status buckets a query asks for, or () for no filter."""
+    q = query.lower()
+    requested = []
+    if "open" in q:
+        requested.append("open")
+    if any(w in q for w in ("closed", "completed", "complete")):
+        requested.append("closed")
+    return tuple(requested)
+
+
 def filter_by_state(results: List[Dict], query: str) -> List[Dict]:
     """Filter results to only include routes matching mentioned states."""
     query_lower = query.lower()
@@ -133,22 +182,37 @@ def filter_by_state(results: List[Dict], query: str) -> List[Dict]:
     return filtered
 
 
-def filter_by_order_status(results: List[Dict], query: str) -> List[Dict]:
-    """Filter results by open/closed order status keywords."""
-    q = query.lower()
-    want_open = "open" in q
-    want_closed = any(w in q for w in ("closed", "completed", "complete"))
+def filter_by_order_status(
+    results: List[Dict],
+    query: str,
+    status_index: Optional[Dict[str, List[Dict]]] = None,
+) -> List[Dict]:
+    """Filter results by open/closed order status keywords.
+
+    Args:
+        results: Result rows to filter.
+        query: The user's query text.
+        status_index: Prebuilt ``build_status_index(results)``, if available.
+
+    Returns:
+        Rows matching the requested statuses, or all rows if none requested.
+    """
+    requested = _requested_statuses(query)
 
-    if not want_open and not want_closed:
+    if not requested:
         return results
 
-    return [
-        r for r in results
-        if "order_status" in r and (
-            (want_open and r["order_status"].lower() == "open")
-            or (want_closed and r["order_status"].lower() in ("closed", "completed"))
-        )
-    ]
+    if len(requested) > 1:
+        # Keep the original interleaving of open and closed rows
+        return [
+            r for r in results
+            if "order_status" in r and _status_bucket(r) in requested
+        ]
+
+    if status_index is None:
+        status_index = build_status_index(results)
+
+    return list(status_index.get(requested[0], []))
 
 
 def filter_by_date(results: List[Dict], query: str) -> List[Dict]:
@@ -258,16 +322,27 @@ def restructure_results(results: List[Dict]) -> List[Dict]:
     return restructured
 
 
-def append_status_counts(results: List[Dict]) -> List[Dict]:
-    """Prepend open/closed order counts to results list."""
+def append_status_counts(
+    results: List[Dict],
+    status_index: Optional[Dict[str, List[Dict]]] = None,
+) -> List[Dict]:
+    """Prepend open/closed order counts to results list.
+
+    Args:
+        results: Result rows to count.
+        status_index: Prebuilt ``build_status_index(results)``, if available.
+
+    Returns:
+        The results, with a counts row prepended when any are non-zero.
+    """
     if not results or "order_status" not in results[0]:
         return results
 
-    open_count = sum(1 for r in results if r.get("order_status", "").lower() == "open")
-    closed_count = sum(
-        1 for r in results
-        if r.get("order_status", "").lower() in ("closed", "completed")
-    )
+    if status_index is None:
+        status_index = build_status_index(results)
+
+    open_count = len(status_index.get("open", []))
+    closed_count = len(status_index.get("closed", []))
 
     counts = {}
     if open_count:
@@ -281,6 +356,34 @@ def append_status_counts(results: List[Dict]) -> List[Dict]:
     return results
 
 
+def apply_filters(results: List[Dict], query: str) -> List[Dict]:
+    """Restructure result rows, apply every query filter and prepend counts.
+
+    The date and state filters are per-row and independent of status, so
+    they run first and the status index is built once on the remaining
+    rows; both the status filter and the counts read from its buckets.
+
+    Args:
+        results: Flat result rows, one per order.
+        query: The user's query text.
+
+    Returns:
+        The filtered rows, with a counts row prepended when applicable.
+    """
+    results = restructure_results(results)
+    results = filter_by_date(results, query)
+    results = filter_by_state(results, query)
+
+    status_index = build_status_index(results)
+    results = filter_by_order_status(results, query, status_index)
+    requested = _requested_statuses(query)
+    if requested:
+        # Only the requested buckets survived the status filter
+        status_index = {status: status_index.get(status, []) for status in requested}
+
+    return append_status_counts(results, status_index)
+
+
 # ─── Main Query Processing ───────────────────────────────────────────────────
 
 def get_user_orders(email: str) -> Optional[List[Dict]]:
@@ -310,24 +413,43 @@ def get_user_orders(email: str) -> Optional[List[Dict]]:
 def ask_llm_for_keys(question: str) -> str:
     """Ask the LLM to identify relevant order schema keys.
 
+    Non-empty answers are cached per whitespace-normalized, lowercased
+    question, so repeated queries skip the LLM round-trip. The LLM always
+    sees the question as the user asked it.
+
     Args:
         question: The user's natural language query.
 
     Returns:
         Comma-separated string of relevant keys.
     """
+    cache_key = normalize_whitespace(question).lower()
+    with _keys_cache_lock:
+        cached = _keys_cache.get(cache_key)
+        if cached is not None:
+            _keys_cache.move_to_end(cache_key)
+            return cached
+
     llm = get_llm()
     messages = [
         {"role": "system", "content": KEY_EXTRACTION_PROMPT},
         {"role": "user", "content": question},
     ]
-    return llm.chat(
+    keys = llm.chat(
         messages,
         model=settings.llm.groq_fast_model,
         temperature=0.1,
         max_tokens=80,
     )
 
+    # An empty reply is likely transient, so let the next ask retry it
+    if keys.strip().strip('"'):
+        with _keys_cache_lock:
+            _keys_cache[cache_key] = keys
+            if len(_keys_cache) > _KEYS_CACHE_SIZE:
+                _keys_cache.popitem(last=False)
+    return keys
+
 
 def process_query(
     query: str, data_list: List[Dict]
@@ -369,20 +491,15 @@ def process_query(
     # Filter by position first
     filtered_data = filter_by_last_order(data_list, query)
 
-    # Fetch data for each key
+    # Resolve the fetchers once, then fetch data for each key
+    fetchers = [(key, KEY_FUNCTIONS[key]) for key in keys if key in KEY_FUNCTIONS]
     results = []
     for data in filtered_data:
         result = {"order_id": fetch_order_id(data)}
-        for key in keys:
-            if key in KEY_FUNCTIONS:
-                result[key] = KEY_FUNCTIONS[key](data)
+        for key, fetch in fetchers:
+            result[key] = fetch(data)
         results.append(result)
 
-    # Apply all filters
-    results = restructure_results(results)
-    results = filter_by_order_status(results, query)
-    results = filter_by_date(results, query)
-    results = filter_by_state(results, query)
-    results = append_status_counts(results)
+    results = apply_filters(results, query)
 
     return json.dumps(results, indent=2)
@@ -6,11 +6,12 @@ and custom LLM to extract structured information from
 state provision PDFs.
 """
 
+import hashlib
+import io
 import json
 import logging
-import os
-import tempfile
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Dict, List, Optional, Union
 
 import requests
 from langchain.chains import ConversationalRetrievalChain
@@ -23,9 +24,30 @@ from PyPDF2 import PdfReader
 
 from config.settings import settings
 from db import get_db
+from utils.text import clean_response
 
 logger = logging.getLogger(__name__)
 
+# Embeddings client shared across provision runs for the process lifetime
+_embeddings: Optional[OpenAIEmbeddings] = None
+
+
+def _get_embeddings() -> OpenAIEmbeddings:
+    """Return the shared OpenAIEmbeddings client, creating it on first use."""
+    global _embeddings
+    if _embeddings is None:
+        options: Dict[str, Any] = {}
+        if settings.llm.embedding_base_url:
+            # tiktoken cannot tokenize non-OpenAI models, so send raw text
+            options["openai_api_base"] = settings.llm.embedding_base_url
+            options["check_embedding_ctx_length"] = False
+        _embeddings = OpenAIEmbeddings(
+            model=settings.llm.embedding_model,
+            openai_api_key=settings.llm.openai_api_key,
+            **options,
+        )
+    return _embeddings
+
 
 class DeepInfraLLM(LLM):
     """Custom LangChain LLM wrapper for DeepInfra API.
@@ -96,24 +118,17 @@ class DeepInfraLLM(LLM):
             return ""
 
 
-def extract_pdf_text(pdf_path: str) -> str:
+def extract_pdf_text(pdf: Union[str, BinaryIO]) -> str:
     """Extract text from a PDF file.
 
     Args:
-        pdf_path: Path to the PDF file.
+        pdf: Path to the PDF file, or a binary file-like object.
 
     Returns:
         Extracted text content.
     """
-    text = ""
-    reader = PdfReader(pdf_path)
-
-    for page in reader.pages:
-        extracted = page.extract_text()
-        if extracted:
-            text += extracted
-
-    return text
+    reader = PdfReader(pdf)
+    return "".join(page.extract_text() or "" for page in reader.pages)
 
 
 def create_text_chunks(
@@ -148,11 +163,7 @@ def create_vectorstore(text_chunks: List[str]) -> FAISS:
     Returns:
         FAISS vector store instance.
     """
-    embeddings = OpenAIEmbeddings(
-        model=settings.llm.embedding_model,
-        openai_api_key=settings.llm.openai_api_key,
-    )
-    return FAISS.from_texts(texts=text_chunks, embedding=embeddings)
+    return FAISS.from_texts(texts=text_chunks, embedding=_get_embeddings())
 
 
 def create_qa_chain(vectorstore: FAISS) -> ConversationalRetrievalChain:
@@ -170,14 +181,14 @@ def create_qa_chain(vectorstore: FAISS) -> ConversationalRetrievalChain:
     )
 
 
-def fetch_provision_pdf(state_name: str) -> str:
+def fetch_provision_pdf(state_name: str) -> bytes:
     """Download a state's provision PDF from MongoDB-stored URL.
 
     Args:
         state_name: Name of the state.
 
     Returns:
-        Path to the downloaded temporary PDF file.
+        Raw PDF bytes.
 
     Raises:
         ValueError: If no PDF link found for the state.
@@ -190,38 +201,72 @@ def fetch_provision_pdf(state_name: str) -> str:
         raise ValueError(f"No provision PDF link found for state: {state_name}")
 
     pdf_url = doc["info"]["provision"]
-    response = requests.get(pdf_url, stream=True, timeout=60)
+    response = requests.get(pdf_url, timeout=60)
 
     if response.status_code != 200:
         raise Exception(f"Failed to download PDF: {pdf_url}")
 
-    temp = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-    with open(temp.name, "wb") as f:
-        for chunk in response.iter_content(chunk_size=1024):
-            f.write(chunk)
+    return response.content
+
+
+def _query_topic(qa_chain: ConversationalRetrievalChain, topic: str) -> str:
+    """Ask the QA chain about a single provision topic.
+
+    Args:
+        qa_chain: Chain built over the state's provision document.
+        topic: Topic to ask about.
+
+    Returns:
+        Cleaned answer text.
+    """
+    query = f"Tell me everything about {topic}"
+    response = qa_chain({"question": query, "chat_history": []})
+    logger.info("Processed topic: %s", topic)
+    return clean_response(response["answer"])
+
 
-    return temp.name
+def _load_cached_provisions(
+    state_name: str, pdf_hash: str, topics: tuple
+) -> Optional[Dict[str, str]]:
+    """Return stored provision answers if they were built from this PDF.
 
+    Args:
+        state_name: Name of the state.
+        pdf_hash: SHA-256 of the downloaded provision PDF.
+        topics: Topics the caller needs answers for.
 
-def _clean_response(text: str) -> str:
-    """Clean up RAG response text."""
-    return "\n".join(line.strip() for line in text.splitlines() if line.strip())
+    Returns:
+        Answers for every requested topic, or None if any must be rebuilt.
+    """
+    doc = get_db().states.find_one(
+        {"state_name": state_name, "info.provision_hash": pdf_hash},
+        {"_id": 0, "info.provision_info": 1},
+    )
+    cached = (doc or {}).get("info", {}).get("provision_info") or {}
+    if not all(topic in cached for topic in topics):
+        return None
+    return {topic: cached[topic] for topic in topics}
 
 
 def process_state_provisions(
     state_name: str,
     topics: Optional[tuple] = None,
     output_path: Optional[str] = None,
+    force: bool = False,
 ) -> Dict[str, str]:
     """Process a state's provision PDF and extract topic-based information.
 
     Downloads the provision PDF, creates a QA chain, and queries
-    each topic to build structured provision data.
+    each topic to build structured provision data. Topics are
+    independent, so up to ``settings.rag.max_concurrent_queries``
+    are queried at once. If the PDF is unchanged since the last run,
+    the stored answers are reused without embedding or querying.
 
     Args:
         state_name: Name of the state to process.
         topics: Tuple of topics to query. Defaults to config.
         output_path: Optional JSON output path.
+        force: Rebuild answers even if the PDF is unchanged.
 
     Returns:
         Dictionary mapping topics to extracted information.
@@ -229,36 +274,46 @@ def process_state_provisions(
     topics = topics or settings.rag.provision_topics
 
     logger.info("Processing provisions for %s", state_name)
-    pdf_path = fetch_provision_pdf(state_name)
-
-    try:
-        raw_text = extract_pdf_text(pdf_path)
-        chunks = create_text_chunks(raw_text)
-        vectorstore = create_vectorstore(chunks)
-        qa_chain = create_qa_chain(vectorstore)
-
-        results: Dict[str, str] = {}
-        for topic in topics:
-            query = f"Tell me everything about {topic}"
-            response = qa_chain({"question": query, "chat_history": []})
-            results[topic] = _clean_response(response["answer"])
-            logger.info("Processed topic: %s", topic)
-
-        # Save to file if requested
+    pdf_bytes = fetch_provision_pdf(state_name)
+    pdf_hash = hashlib.sha256(pdf_bytes).hexdigest()
+
+    cached = None if force else _load_cached_provisions(state_name, pdf_hash, topics)
+    if cached is not None:
+        logger.info("Provision PDF for %s unchanged, reusing stored results", state_name)
         if output_path:
             with open(output_path, "w") as f:
-                json.dump(results, f, indent=4)
-
-        # Update MongoDB
-        db = get_db()
-        db.states.update_one(
-            {"state_name": state_name},
-            {"$set": {"info.provision_info": results}},
-        )
-
-        logger.info("Successfully processed %s", state_name)
-        return results
+                json.dump(cached, f, indent=4)
+        return cached
+
+    raw_text = extract_pdf_text(io.BytesIO(pdf_bytes))
+    chunks = create_text_chunks(raw_text)
+    vectorstore = create_vectorstore(chunks)
+    qa_chain = create_qa_chain(vectorstore)
+
+    with ThreadPoolExecutor(
+        max_workers=settings.rag.max_concurrent_queries,
+        thread_name_prefix="provisions",
+    ) as pool:
+        answers = pool.map(lambda topic: _query_topic(qa_chain, topic), topics)
+        results: Dict[str, str] = dict(zip(topics, answers))
+
+    # Save to file if requested
+    if output_path:
+        with open(output_path, "w") as f:
+            json.dump(results, f, indent=4)
+
+    # Update MongoDB
+    db = get_db()
+    db.states.update_one(
+        {"state_name": state_name},
+        {
+            "$set": {
+                "state_name_lc": state_name.lower(),
+                "info.provision_info": results,
+                "info.provision_hash": pdf_hash,
+            }
+        },
+    )
 
-    finally:
-        if os.path.exists(pdf_path):
-            os.remove(pdf_path)
+    logger.info("Successfully processed %s", state_name)
+    return results
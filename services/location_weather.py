@@ -5,10 +5,13 @@ Provides geolocation and weather information using
 IP-based geocoding and the OpenWeatherMap API.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Optional, Tuple
 
 import geocoder
+import orjson
 import requests
 from geopy.geocoders import Nominatim
 from timezonefinder import TimezoneFinder
@@ -18,26 +21,78 @@ from config.settings import settings
 logger = logging.getLogger(__name__)
 
 
-def get_location() -> Optional[Dict[str, Any]]:
-    """Get the current user location via IP geolocation.
+# Cached lookups shared across calls for the lifetime of the session
+_timezone_finder: Optional[TimezoneFinder] = None
+_location_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+
+def _get_timezone_finder() -> TimezoneFinder:
+    """Return the shared TimezoneFinder, loading its data on first use."""
+    global _timezone_finder
+    if _timezone_finder is None:
+        _timezone_finder = TimezoneFinder()
+    return _timezone_finder
+
+
+def _reverse_geocode(lat: float, lng: float) -> Any:
+    """Reverse geocode coordinates with Nominatim (blocking)."""
+    geolocator = Nominatim(user_agent="heavyhaul-ai-assistant")
+    return geolocator.reverse(f"{lat}, {lng}")
+
+
+def _lookup_ip_location() -> Optional[Dict[str, Any]]:
+    """Resolve location and timezone from a single IP geolocation call.
 
     Returns:
-        Dictionary with latitude, longitude, city, state, country,
-        formatted address, and timezone. None on failure.
+        Location dictionary, or None if the provider had no answer.
+    """
+    response = requests.get(settings.weather.ip_location_url, timeout=5)
+    if response.status_code != 200:
+        return None
+
+    data = orjson.loads(response.content)
+    if data.get("error") or data.get("latitude") is None:
+        return None
+
+    city = data.get("city")
+    state = data.get("region")
+    country = data.get("country_name")
+    return {
+        "latitude": data["latitude"],
+        "longitude": data.get("longitude"),
+        "city": city,
+        "state": state,
+        "country": country,
+        "formatted_address": ", ".join(part for part in (city, state, country) if part),
+        "timezone": data.get("timezone"),
+    }
+
+
+async def _lookup_reverse_geocoded_location() -> Optional[Dict[str, Any]]:
+    """Resolve location via IP geocode followed by a Nominatim reverse lookup.
+
+    The IP lookup runs concurrently with loading the timezone data, and
+    the reverse geocode runs concurrently with the timezone lookup.
+
+    Returns:
+        Location dictionary, or None on failure.
     """
     try:
-        g = geocoder.ip("me")
+        g, tf = await asyncio.gather(
+            asyncio.to_thread(geocoder.ip, "me"),
+            asyncio.to_thread(_get_timezone_finder),
+        )
         if not g.ok:
             return None
 
-        geolocator = Nominatim(user_agent="heavyhaul-ai-assistant")
-        location = geolocator.reverse(f"{g.lat}, {g.lng}")
+        location, timezone = await asyncio.gather(
+            asyncio.to_thread(_reverse_geocode, g.lat, g.lng),
+            asyncio.to_thread(tf.timezone_at, lat=g.lat, lng=g.lng),
+        )
         if location is None:
             return None
 
         address = location.raw.get("address", {})
-        tf = TimezoneFinder()
-
         return {
             "latitude": g.lat,
             "longitude": g.lng,
@@ -45,20 +100,52 @@ def get_location() -> Optional[Dict[str, Any]]:
             "state": address.get("state"),
             "country": address.get("country"),
             "formatted_address": location.address,
-            "timezone": tf.timezone_at(lat=g.lat, lng=g.lng),
+            "timezone": timezone,
         }
     except Exception as e:
         logger.error("Error getting location: %s", e)
         return None
 
 
-def get_location_string() -> str:
+async def get_location() -> Optional[Dict[str, Any]]:
+    """Get the current user location via IP geolocation.
+
+    Tries a single-call IP provider that returns city, region, country,
+    and timezone in one response, falling back to the IP geocode plus
+    reverse geocode path. The result is cached for
+    ``settings.weather.location_cache_ttl`` seconds.
+
+    Returns:
+        Dictionary with latitude, longitude, city, state, country,
+        formatted address, and timezone. None on failure.
+    """
+    global _location_cache
+    if _location_cache is not None:
+        cached_at, cached = _location_cache
+        if time.monotonic() - cached_at < settings.weather.location_cache_ttl:
+            return cached
+
+    try:
+        result = await asyncio.to_thread(_lookup_ip_location)
+    except Exception as e:
+        logger.warning("Single-call IP location lookup failed: %s", e)
+        result = None
+
+    if result is None:
+        result = await _lookup_reverse_geocoded_location()
+
+    if result is not None:
+        _location_cache = (time.monotonic(), result)
+    return result
+
+
+async def get_location_string() -> str:
     """Get a human-readable location string.
 
     Returns:
         Formatted location string or error message.
     """
-    location_data = get_location()
+    location_data = await get_location()
     if location_data:
         return (
             f"You are in {location_data['city']}, "
@@ -67,17 +154,18 @@ def get_location_string() -> str:
     return "I'm sorry, I couldn't determine your location."
 
 
-def get_weather() -> str:
+async def get_weather() -> str:
     """Get weather for the current location.
 
     Returns:
         Formatted weather string or error message.
     """
-    location = get_location()
+    location = await get_location()
     if not location:
         return "Unable to determine location for weather information."
 
-    return _fetch_weather(
+    return await asyncio.to_thread(
+        _fetch_weather,
         lat=location["latitude"],
         lon=location["longitude"],
         city_name=location.get("city", "your location"),
@@ -105,7 +193,7 @@ def get_weather_by_city(city_name: str) -> str:
         if response.status_code != 200:
             return f"Unable to fetch weather information for {city_name}."
 
-        return _format_weather(response.json(), city_name)
+        return _format_weather(orjson.loads(response.content), city_name)
 
     except Exception as e:
         logger.error("Error getting weather for %s: %s", city_name, e)
@@ -139,7 +227,7 @@ def _fetch_weather(
         if response.status_code != 200:
             return "Unable to fetch weather information."
 
-        return _format_weather(response.json(), city_name)
+        return _format_weather(orjson.loads(response.content), city_name)
 
     except Exception as e:
         logger.error("Error fetching weather: %s", e)
@@ -156,9 +244,10 @@ def _format_weather(data: Dict[str, Any], city_name: str) -> str:
     Returns:
         Formatted weather description.
     """
-    temperature = round(data["main"]["temp"])
-    feels_like = round(data["main"]["feels_like"])
-    humidity = data["main"]["humidity"]
+    main = data["main"]
+    temperature = round(main["temp"])
+    feels_like = round(main["feels_like"])
+    humidity = main["humidity"]
     description = data["weather"][0]["description"]
 
     return (
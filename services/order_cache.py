@@ -5,13 +5,21 @@ Provides file-based caching of order details to reduce repeated
 database queries for the same order data.
 """
 
-import json
+import contextlib
 import logging
 import os
+import stat
+import tempfile
 from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Process umask, read once; os.umask can only be queried by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 
 class OrderCache:
     """File-based order cache with in-memory current order tracking.
@@ -61,6 +69,10 @@ class OrderCache:
     ) -> bool:
         """Save order details to cache file.
 
+        The payload is written to a temporary file in the cache directory,
+        fsynced, and atomically moved into place so a crash mid-write never
+        leaves a truncated cache file behind.
+
         Args:
             order_id: The order ID to cache.
             order_details: Order detail data.
@@ -70,6 +82,7 @@ class OrderCache:
         Returns:
             True if save succeeded, False otherwise.
         """
+        tmp_path: Optional[str] = None
         try:
             cache_data = {
                 "order_details": order_details,
@@ -77,11 +90,30 @@ class OrderCache:
                 "role": role,
             }
             cache_path = self._get_cache_path(order_id, role)
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+            payload = orjson.dumps(
+                cache_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+
+            # mkstemp creates the file 0600; give it the mode a plain open()
+            # would, or keep the existing cache file's mode
+            try:
+                mode = stat.S_IMODE(os.stat(cache_path).st_mode)
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, cache_path)
             return True
         except Exception as e:
             logger.error("Error saving to cache: %s", e)
+            if tmp_path and os.path.exists(tmp_path):
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
             return False
 
     def load(
@@ -99,8 +131,8 @@ class OrderCache:
         try:
             cache_path = self._get_cache_path(order_id, role)
             if os.path.exists(cache_path):
-                with open(cache_path, "r", encoding="utf-8") as f:
-                    cache_data = json.load(f)
+                with open(cache_path, "rb") as f:
+                    cache_data = orjson.loads(f.read())
                 if cache_data.get("role") == role:
                     return cache_data["order_details"], cache_data["explanation"]
             return None, None
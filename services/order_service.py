@@ -12,36 +12,70 @@ from typing import Any, Dict, List, Optional, Tuple
 from config.constants import POSITION_DESCRIPTIONS, POSITION_MAPPINGS
 from db import get_db
 from services.data_filter import filter_order_by_role
+from utils.data import ensure_sorted_desc
 
 logger = logging.getLogger(__name__)
 
+# Ordinal references ("3rd latest"), position phrases ("third last",
+# "latest", ...) longest-first, and bare numbers fused so one pass over the
+# query finds every kind of order reference.
+_CONTEXT_RE = re.compile(
+    r"(?P<ordinal>(?P<rank>\d+)(?:st|nd|rd|th)\s+latest)|(?P<position>"
+    + "|".join(
+        re.escape(text) for text in sorted(POSITION_MAPPINGS, key=len, reverse=True)
+    )
+    + r")|(?P<number>\b\d+\b)"
+)
+
+# Admin order ID patterns, in priority order
+_ADMIN_ORDER_ID_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"order\s+#?(\d{4,})",
+        r"#(\d{4,})",
+        r"\b(\d{4,})\b",
+        r"(?:about|for|id)\s+#?(\d{4,})",
+    )
+)
+
 
-def get_admin_order_id(query: str) -> Optional[int]:
+def get_admin_order_id(
+    query: str, query_lower: Optional[str] = None
+) -> Optional[int]:
     """Extract an order ID from an admin's natural language query.
 
     Supports patterns like 'order 2892', '#2892', 'about 2892'.
 
     Args:
         query: The user's query text.
+        query_lower: Pre-lowercased query, if the caller already has one.
 
     Returns:
         The validated order ID, or None if not found.
     """
-    patterns = [
-        r"order\s+#?(\d{4,})",
-        r"#(\d{4,})",
-        r"\b(\d{4,})\b",
-        r"(?:about|for|id)\s+#?(\d{4,})",
-    ]
+    if query_lower is None:
+        query_lower = query.lower()
+
+    candidates: List[int] = []
+    for pattern in _ADMIN_ORDER_ID_PATTERNS:
+        match = pattern.search(query_lower)
+        if match:
+            order_id = int(match.group(1))
+            if order_id not in candidates:
+                candidates.append(order_id)
+
+    if not candidates:
+        return None
 
-    db = get_db()
     try:
-        for pattern in patterns:
-            match = re.search(pattern, query.lower())
-            if match:
-                order_id = int(match.group(1))
-                if db.orders.find_one({"id": order_id}):
-                    return order_id
+        db = get_db()
+        existing = {
+            doc["id"]
+            for doc in db.orders.find({"id": {"$in": candidates}}, {"id": 1, "_id": 0})
+        }
+        for order_id in candidates:
+            if order_id in existing:
+                return order_id
     except Exception as e:
         logger.error("Error extracting admin order ID: %s", e)
 
@@ -68,9 +102,11 @@ def resolve_order_context(
         Tuple of (should_switch, order_ids, explanation).
     """
     try:
+        query_lower = query.lower()
+
         # Admin role: extract order ID from query
         if "admin_info" in user_data:
-            order_id = get_admin_order_id(query)
+            order_id = get_admin_order_id(query, query_lower)
             if order_id:
                 return True, [order_id], f"Accessing order {order_id} as admin"
             elif current_order_id:
@@ -83,63 +119,68 @@ def resolve_order_context(
 
         # Driver/Client role: use order list
         if "driver_info" in user_data:
-            order_ids = sorted(
-                user_data["driver_info"]["order_ids"], reverse=True
-            )
+            order_ids = ensure_sorted_desc(user_data["driver_info"]["order_ids"])
             user_type = "driver"
         elif "client_info" in user_data:
-            order_ids = sorted(
-                user_data["client_info"]["order_ids"], reverse=True
-            )
+            order_ids = ensure_sorted_desc(user_data["client_info"]["order_ids"])
             user_type = "client"
         else:
             return False, [], "Invalid user data"
 
-        query_lower = query.lower()
+        order_positions = {oid: index for index, oid in enumerate(order_ids)}
+
+        # Single pass: the first position/ordinal reference wins; otherwise
+        # remember the first number that is one of the user's orders.
+        position_match = None
+        direct_oid: Optional[int] = None
+        for match in _CONTEXT_RE.finditer(query_lower):
+            number = match.group("number")
+            if number is None:
+                position_match = match
+                break
+            if direct_oid is None and int(number) in order_positions:
+                direct_oid = int(number)
 
         # Check position references ("third last", "latest", etc.)
-        for position_text, index in POSITION_MAPPINGS.items():
-            if position_text in query_lower:
-                if index < len(order_ids):
-                    oid = order_ids[index]
-                    desc = POSITION_DESCRIPTIONS.get(index, f"{index + 1}th latest")
-                    return True, [oid], f"Using {desc} order ({oid}) for {user_type}"
-                return (
-                    False,
-                    [],
-                    f"No {position_text} order available for {user_type}",
-                )
+        if position_match and position_match.group("position"):
+            position_text = position_match.group("position")
+            index = POSITION_MAPPINGS[position_text]
+            if index < len(order_ids):
+                oid = order_ids[index]
+                desc = POSITION_DESCRIPTIONS.get(index, f"{index + 1}th latest")
+                return True, [oid], f"Using {desc} order ({oid}) for {user_type}"
+            return (
+                False,
+                [],
+                f"No {position_text} order available for {user_type}",
+            )
 
         # Handle ordinal numbers ("3rd latest", "1st latest")
-        ordinal_pattern = re.compile(r"(\d+)(?:st|nd|rd|th)\s+latest")
-        ordinal_match = ordinal_pattern.search(query_lower)
-        if ordinal_match:
-            index = int(ordinal_match.group(1)) - 1
+        if position_match:
+            ordinal_text = position_match.group("ordinal")
+            index = int(position_match.group("rank")) - 1
             if index < len(order_ids):
                 oid = order_ids[index]
                 return (
                     True,
                     [oid],
-                    f"Using {ordinal_match.group(0)} order ({oid}) for {user_type}",
+                    f"Using {ordinal_text} order ({oid}) for {user_type}",
                 )
             return (
                 False,
                 [],
-                f"No {ordinal_match.group(0)} order available for {user_type}",
+                f"No {ordinal_text} order available for {user_type}",
             )
 
         # Handle direct order ID mentions
-        numbers = re.findall(r"\b\d+\b", query)
-        for num in numbers:
-            oid = int(num)
-            if oid in order_ids:
-                position = order_ids.index(oid)
-                desc = POSITION_DESCRIPTIONS.get(position, f"{position + 1}th latest")
-                return (
-                    True,
-                    [oid],
-                    f"Using order {oid} ({desc} order) for {user_type}",
-                )
+        if direct_oid is not None:
+            position = order_positions[direct_oid]
+            desc = POSITION_DESCRIPTIONS.get(position, f"{position + 1}th latest")
+            return (
+                True,
+                [direct_oid],
+                f"Using order {direct_oid} ({desc} order) for {user_type}",
+            )
 
         # Continue with current order if set
         if current_order_id is not None:
@@ -10,7 +10,6 @@ import logging
 from typing import Any, Dict, Optional
 
 from config.constants import (
-    ORDER_SWITCH_KEYWORDS,
     PERMIT_SYSTEM_PROMPT,
     PROVISION_KEYWORDS,
     STATES,
@@ -19,68 +18,101 @@ from config.settings import settings
 from db import get_db
 from services.llm_client import get_llm
 from services.speech_service import SpeechSynthesizer, take_command
-from utils.text import split_sentences
+from utils.text import (
+    ORDER_SWITCH_RE,
+    compile_keyword_pattern,
+    find_state_name,
+    split_sentences,
+)
 
 logger = logging.getLogger(__name__)
 
+# Precompiled matchers for per-turn intent dispatch
+_PROVISION_RE = compile_keyword_pattern(PROVISION_KEYWORDS)
+_STATES_BY_COMPACT = {state.lower().replace(" ", ""): state for state in STATES}
+_STATE_COMPACT_RE = compile_keyword_pattern(_STATES_BY_COMPACT)
 
-def get_state_permit_info(
-    order_id: int, state_name: str
-) -> Optional[Dict[str, Any]]:
-    """Fetch permit information for a specific state within an order.
+
+def get_order_permit_index(order_id: int) -> Dict[str, Dict[str, Any]]:
+    """Index an order's permit information by lowercase state name.
 
     Args:
         order_id: The order ID.
-        state_name: The state name to look up permits for.
 
     Returns:
-        Permit info dictionary, or None if not found.
+        Mapping of lowercase state name to permit info. Empty if the
+        order is missing or has no permit information.
     """
     try:
         order_id = int(order_id)
     except (ValueError, TypeError):
-        return None
+        return {}
 
     db = get_db()
-    order_doc = db.orders.find_one({"id": order_id})
+    order_doc = db.orders.find_one(
+        {"id": order_id},
+        {
+            "_id": 0,
+            "order.routeData.product_name": 1,
+            "order.routeData.permit_info": 1,
+        },
+    )
     if not order_doc:
-        return None
+        return {}
 
     order_data = order_doc.get("order", {})
     if not isinstance(order_data, dict):
-        return None
+        return {}
 
-    route_data = order_data.get("routeData", [])
-    for state_obj in route_data:
-        if state_obj.get("product_name", "").lower() == state_name.lower():
-            permit_info = state_obj.get("permit_info", {})
-            if permit_info:
-                return permit_info
+    permit_index: Dict[str, Dict[str, Any]] = {}
+    for state_obj in order_data.get("routeData", []):
+        permit_info = state_obj.get("permit_info", {})
+        if permit_info:
+            state_key = state_obj.get("product_name", "").lower()
+            permit_index.setdefault(state_key, permit_info)
 
-    return None
+    return permit_index
+
+
+def get_state_permit_info(
+    order_id: int, state_name: str
+) -> Optional[Dict[str, Any]]:
+    """Fetch permit information for a specific state within an order.
+
+    Args:
+        order_id: The order ID.
+        state_name: The state name to look up permits for.
+
+    Returns:
+        Permit info dictionary, or None if not found.
+    """
+    return get_order_permit_index(order_id).get(state_name.lower())
 
 
-def extract_state_name(query: str) -> Optional[str]:
+def extract_state_name(
+    query: str, query_lower: Optional[str] = None
+) -> Optional[str]:
     """Extract a state name from a query, with fuzzy matching.
 
     Args:
         query: The user's query text.
+        query_lower: Pre-lowercased query, if the caller already has one.
 
     Returns:
         Matched state name, or None.
     """
-    query_lower = query.lower()
+    if query_lower is None:
+        query_lower = query.lower()
 
     # Exact match
-    for state in STATES:
-        if state.lower() in query_lower:
-            return state
+    state_name = find_state_name(query_lower)
+    if state_name:
+        return state_name
 
     # No-space fuzzy match
-    query_compact = query_lower.replace(" ", "")
-    for state in STATES:
-        if state.lower().replace(" ", "") in query_compact:
-            return state
+    match = _STATE_COMPACT_RE.search(query_lower.replace(" ", ""))
+    if match:
+        return _STATES_BY_COMPACT[match.group(0)]
 
     return None
 
@@ -115,6 +147,8 @@ async def chat_with_permit_info(
             await speech_synthesizer.text_to_speech("Invalid order ID.")
             return "orders"
 
+    # Load the order's permits once; state switches become dict lookups
+    permit_index = get_order_permit_index(order_id)
     current_state: Optional[str] = None
     current_permit_info: Optional[Dict[str, Any]] = None
 
@@ -131,23 +165,24 @@ async def chat_with_permit_info(
                 continue
 
             print(f"You asked: {user_query}")
+            query_lower = user_query.lower()
 
             # Check for system switching
-            if any(kw in user_query.lower() for kw in ORDER_SWITCH_KEYWORDS):
+            if ORDER_SWITCH_RE.search(query_lower):
                 await speech_synthesizer.text_to_speech("Switching back to order system")
                 return "orders"
 
-            if any(kw in user_query.lower() for kw in PROVISION_KEYWORDS):
+            if _PROVISION_RE.search(query_lower):
                 return "states"
 
-            if user_query.lower() == "exit":
+            if query_lower == "exit":
                 return "exit"
 
             # Detect state change
-            new_state = extract_state_name(user_query)
+            new_state = extract_state_name(user_query, query_lower)
             if new_state and new_state != current_state:
                 current_state = new_state
-                current_permit_info = get_state_permit_info(order_id, current_state)
+                current_permit_info = permit_index.get(current_state.lower())
 
                 if not current_permit_info:
                     msg = f"No permit information found for {current_state}."
@@ -1,16 +1,24 @@
 import asyncio
+import heapq
+import itertools
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import IntEnum
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar
 
 from db import get_db
 from services.llm_client import get_llm
 from services.location_weather import get_weather_by_city
+from utils.data import BoundedSet
+from utils.text import compile_keyword_pattern
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 # ─── Alert Priority ──────────────────────────────────────────────────────────
 
@@ -27,7 +35,7 @@ class AlertPriority(IntEnum):
 # ─── Alert Data Model ────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class ProactiveAlert:
     """A single proactive alert to be delivered to the user."""
 
@@ -37,12 +45,17 @@ class ProactiveAlert:
     message: str  # Full spoken message for TTS
     order_id: Optional[int] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: float = field(default_factory=time.time)  # Unix timestamp
     delivered: bool = False
+    key: Tuple[str, Optional[int], str] = field(init=False)  # Deduplication key
+
+    def __post_init__(self) -> None:
+        self.key = (self.alert_type, self.order_id, self.title)
 
-    def __lt__(self, other: "ProactiveAlert") -> bool:
-        """Compare by priority (lower value = higher priority)."""
-        return self.priority < other.priority
+    @property
+    def created_at_dt(self) -> datetime:
+        """Creation time as a local datetime."""
+        return datetime.fromtimestamp(self.created_at)
 
 
 # ─── Proactive Monitor ───────────────────────────────────────────────────────
@@ -59,9 +72,63 @@ class ProactiveMonitor:
         user_role: The active user's role.
         user_email: The active user's email.
         poll_interval: Seconds between monitoring cycles.
-        alert_queue: Priority-sorted queue of pending alerts.
     """
 
+    # Driver/client fields read when listing the user's orders
+    _USER_ORDER_IDS_PROJECTION: Dict[str, int] = {"_id": 0, "order_ids": 1}
+
+    # Order fields read by each checker
+    _STATUS_FIELDS = ("status", "order_status", "orderStatus", "state")
+    _STATUS_PROJECTION: Dict[str, int] = {
+        "_id": 0,
+        "id": 1,
+        **{f"order.{name}": 1 for name in _STATUS_FIELDS},
+    }
+    _CYCLE_PROJECTION: Dict[str, int] = {
+        **_STATUS_PROJECTION,
+        "order.routeData": 1,
+        "order.delivery_date": 1,
+        "order.end_date": 1,
+        "order.estimated_delivery": 1,
+    }
+    _ORIGIN_FIELDS = ("origin_city", "pickup_city", "from_city")
+    _DEST_FIELDS = ("destination_city", "delivery_city", "to_city")
+    _ROUTE_CITY_FIELDS = (*_ORIGIN_FIELDS, *_DEST_FIELDS)
+    _WEATHER_PROJECTION: Dict[str, int] = {
+        **_STATUS_PROJECTION,
+        **{f"order.{name}": 1 for name in _ROUTE_CITY_FIELDS},
+        "order.routeData.product_name": 1,
+    }
+
+    # Weather descriptions that warrant a route alert, matched in one pass
+    _SEVERE_WEATHER_RE = compile_keyword_pattern((
+        "storm", "thunderstorm", "tornado", "hurricane",
+        "blizzard", "heavy rain", "heavy snow", "ice",
+        "freezing rain", "hail", "flood", "warning",
+        "extreme", "severe", "dangerous", "advisory",
+        "high wind", "gale", "fog",
+    ))
+
+    # Permit statuses that need attention regardless of dates
+    _BAD_PERMIT_STATUSES = frozenset({"expired", "rejected", "cancelled"})
+
+    # Fallback formats for values fromisoformat rejects (including the
+    # trailing "Z" form on Python 3.10)
+    _DATE_FORMATS = (
+        "%Y-%m-%dT%H:%M:%S.%fZ",
+        "%Y-%m-%dT%H:%M:%SZ",
+        "%m/%d/%Y",
+        "%m/%d/%Y %H:%M:%S",
+        "%d-%m-%Y",
+        "%B %d, %Y",
+    )
+
+    # Most delivered/warned keys remembered for deduplication
+    _MAX_TRACKED_KEYS = 10_000
+
+    # Seconds to reuse the user's order ID list between lookups
+    _ORDER_IDS_TTL = 60
+
     def __init__(
         self,
         user_role: str,
@@ -88,33 +155,54 @@ class ProactiveMonitor:
         self.permit_warning_days = permit_warning_days
         self.deadline_warning_hours = deadline_warning_hours
 
-        # Alert queue and deduplication
-        self.alert_queue: List[ProactiveAlert] = []
-        self._delivered_keys: Set[str] = set()
+        # Alert heap ordered by (priority, created_at, seq) and deduplication.
+        # Delivered alerts are dropped lazily when they reach the top.
+        self._alert_heap: List[Tuple[int, float, int, ProactiveAlert]] = []
+        self._alert_seq = itertools.count()
+        self._delivered_keys: BoundedSet[Tuple[str, Optional[int], str]] = BoundedSet(
+            self._MAX_TRACKED_KEYS
+        )
 
         # Snapshot of previous state for change detection
         self._last_order_statuses: Dict[int, str] = {}
         self._last_order_ids: Set[int] = set()
-        self._warned_permits: Set[str] = set()
-        self._warned_deadlines: Set[int] = set()
+        self._warned_permits: BoundedSet[Tuple[int, str]] = BoundedSet(
+            self._MAX_TRACKED_KEYS
+        )
+        self._warned_deadlines: BoundedSet[int] = BoundedSet(self._MAX_TRACKED_KEYS)
+
+        # User order IDs as (fetched_at, ids), shared by all checkers
+        self._order_ids_cache: Optional[Tuple[float, List[int]]] = None
+        self._order_ids_lock = asyncio.Lock()
+
+        # Parsed date strings keyed by (order_id, raw value)
+        self._date_cache: Dict[Tuple[int, str], Optional[datetime]] = {}
+
+        # Last LLM summary as (signature of summarized alerts, summary)
+        self._summary_cache: Optional[Tuple[Tuple[Any, ...], str]] = None
+
+        # Worker threads for blocking MongoDB calls, created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
 
         # Control flags
         self._running = False
         self._task: Optional[asyncio.Task] = None
         self._weather_task: Optional[asyncio.Task] = None
 
+        # Database handle and collections, bound once for the monitor's lifetime
+        self.invalidate_db_cache()
+
     # ─── Lifecycle ────────────────────────────────────────────────────────
 
-    def start(self) -> None:
-        """Start background monitoring tasks."""
+    async def start(self) -> None:
+        """Start background monitoring tasks on the running event loop."""
         if self._running:
             logger.warning("Proactive monitor already running")
             return
 
         self._running = True
-        loop = asyncio.get_event_loop()
-        self._task = loop.create_task(self._monitor_loop())
-        self._weather_task = loop.create_task(self._weather_loop())
+        self._task = asyncio.create_task(self._monitor_loop())
+        self._weather_task = asyncio.create_task(self._weather_loop())
         logger.info(
             "Proactive monitor started (poll=%ds, weather=%ds)",
             self.poll_interval,
@@ -128,12 +216,26 @@ class ProactiveMonitor:
             self._task.cancel()
         if self._weather_task and not self._weather_task.done():
             self._weather_task.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
         logger.info("Proactive monitor stopped")
 
+    def invalidate_db_cache(self) -> None:
+        """Rebind the cached database handle and collection references.
+
+        Call this after the MongoDB connection has been re-established.
+        """
+        self._db = get_db()
+        self._orders = self._db.orders
+        self._drivers = self._db.drivers
+        self._clients = self._db.clients
+
     @property
     def has_alerts(self) -> bool:
         """Check if there are pending undelivered alerts."""
-        return any(not a.delivered for a in self.alert_queue)
+        self._drop_delivered_top()
+        return bool(self._alert_heap)
 
     def get_pending_alerts(self) -> List[ProactiveAlert]:
         """Get all pending alerts sorted by priority.
@@ -141,28 +243,37 @@ class ProactiveMonitor:
         Returns:
             List of undelivered alerts, highest priority first.
         """
-        pending = [a for a in self.alert_queue if not a.delivered]
-        pending.sort()
-        return pending
+        self._drop_delivered_top()
+        pending = [entry for entry in self._alert_heap if not entry[-1].delivered]
+        return [entry[-1] for entry in sorted(pending)]
 
     def mark_delivered(self, alert: ProactiveAlert) -> None:
         """Mark an alert as delivered so it won't be repeated."""
-        alert.delivered = True
-        key = self._alert_key(alert)
-        self._delivered_keys.add(key)
+        if not alert.delivered:
+            alert.delivered = True
+            self._summary_cache = None
+        self._delivered_keys.add(alert.key)
+
+    def _drop_delivered_top(self) -> None:
+        """Pop delivered alerts off the top of the heap."""
+        while self._alert_heap and self._alert_heap[0][-1].delivered:
+            heapq.heappop(self._alert_heap)
 
     def clear_old_alerts(self, max_age_hours: int = 24) -> None:
         """Remove delivered alerts older than max_age_hours."""
-        cutoff = datetime.now() - timedelta(hours=max_age_hours)
-        self.alert_queue = [
-            a for a in self.alert_queue
-            if not a.delivered or a.created_at > cutoff
+        cutoff = time.time() - max_age_hours * 3600
+        self._alert_heap = [
+            entry for entry in self._alert_heap
+            if not entry[-1].delivered or entry[-1].created_at > cutoff
         ]
+        heapq.heapify(self._alert_heap)
 
     # ─── Background Loops ────────────────────────────────────────────────
 
     async def _monitor_loop(self) -> None:
         """Main monitoring loop for orders, permits, and deadlines."""
+        await self._ensure_indexes()
+
         # Initial snapshot (don't alert on first run)
         await self._take_initial_snapshot()
 
@@ -172,10 +283,7 @@ class ProactiveMonitor:
                 if not self._running:
                     break
 
-                await self._check_order_status_changes()
-                await self._check_new_order_assignments()
-                await self._check_permit_expirations()
-                await self._check_delivery_deadlines()
+                await self._run_cycle()
                 self.clear_old_alerts()
 
             except asyncio.CancelledError:
@@ -184,6 +292,33 @@ class ProactiveMonitor:
                 logger.error("Error in proactive monitor loop: %s", e)
                 await asyncio.sleep(10)
 
+    async def _ensure_indexes(self) -> None:
+        """Create the indexes behind the monitor's lookups concurrently.
+
+        ``create_index`` is a no-op when the index already exists. The ETL
+        pipeline upserts on these keys, so each is unique.
+        """
+        await asyncio.gather(
+            *(
+                self._run_blocking(self._ensure_index, collection, key)
+                for collection, key in (
+                    (self._orders, "id"),
+                    (self._drivers, "email"),
+                    (self._clients, "email"),
+                )
+            )
+        )
+
+    @staticmethod
+    def _ensure_index(collection: Any, key: str) -> None:
+        """Create a unique index on one collection key (blocking)."""
+        try:
+            collection.create_index(key, unique=True)
+        except Exception as e:
+            logger.warning(
+                "Could not ensure index on %s.%s: %s", collection.name, key, e
+            )
+
     async def _weather_loop(self) -> None:
         """Weather monitoring loop (runs less frequently)."""
         # Wait a bit before first weather check
@@ -204,12 +339,14 @@ class ProactiveMonitor:
     async def _take_initial_snapshot(self) -> None:
         """Capture current state so first cycle doesn't generate false alerts."""
         try:
-            order_ids = self._get_user_order_ids()
+            order_ids = await self._get_user_order_ids()
+            if order_ids is None:
+                return
             self._last_order_ids = set(order_ids)
 
-            db = get_db()
+            docs = await self._fetch_orders(order_ids, self._STATUS_PROJECTION)
             for oid in order_ids:
-                doc = db.orders.find_one({"id": oid})
+                doc = docs.get(oid)
                 if doc:
                     status = self._extract_order_status(doc)
                     self._last_order_statuses[oid] = status
@@ -221,16 +358,49 @@ class ProactiveMonitor:
         except Exception as e:
             logger.error("Error taking initial snapshot: %s", e)
 
+    # ─── Monitoring Cycle ─────────────────────────────────────────────────
+
+    async def _run_cycle(self) -> None:
+        """Run one monitoring cycle over a single shared order fetch."""
+        order_ids = await self._get_user_order_ids()
+        if order_ids is None:
+            # Skip the cycle rather than treat every order as departed
+            return
+        docs = await self._fetch_orders(order_ids, self._CYCLE_PROJECTION)
+
+        self._check_order_status_changes(order_ids, docs)
+        self._check_new_order_assignments(order_ids)
+        self._check_permit_expirations(order_ids, docs)
+        self._check_delivery_deadlines(order_ids, docs)
+        self._prune_departed_orders()
+
+    def _prune_departed_orders(self) -> None:
+        """Drop per-order state for orders no longer assigned to the user."""
+        active = self._last_order_ids
+        for permit_key in [k for k in self._warned_permits if k[0] not in active]:
+            self._warned_permits.discard(permit_key)
+        for oid in [k for k in self._warned_deadlines if k not in active]:
+            self._warned_deadlines.discard(oid)
+        self._date_cache = {
+            key: parsed
+            for key, parsed in self._date_cache.items()
+            if key[0] in active
+        }
+
     # ─── Order Status Changes ─────────────────────────────────────────────
 
-    async def _check_order_status_changes(self) -> None:
-        """Detect and alert on order status changes."""
-        try:
-            db = get_db()
-            order_ids = self._get_user_order_ids()
+    def _check_order_status_changes(
+        self, order_ids: List[int], docs: Dict[int, Dict[str, Any]]
+    ) -> None:
+        """Detect and alert on order status changes.
 
+        Args:
+            order_ids: The user's current order IDs.
+            docs: Order documents for this cycle, keyed by order ID.
+        """
+        try:
             for oid in order_ids:
-                doc = db.orders.find_one({"id": oid})
+                doc = docs.get(oid)
                 if not doc:
                     continue
 
@@ -261,10 +431,14 @@ class ProactiveMonitor:
 
     # ─── New Order Assignments ────────────────────────────────────────────
 
-    async def _check_new_order_assignments(self) -> None:
-        """Detect newly assigned orders for the user."""
+    def _check_new_order_assignments(self, order_ids: List[int]) -> None:
+        """Detect newly assigned orders for the user.
+
+        Args:
+            order_ids: The user's current order IDs.
+        """
         try:
-            current_order_ids = set(self._get_user_order_ids())
+            current_order_ids = set(order_ids)
             new_ids = current_order_ids - self._last_order_ids
 
             for oid in new_ids:
@@ -288,15 +462,20 @@ class ProactiveMonitor:
 
     # ─── Permit Expirations ───────────────────────────────────────────────
 
-    async def _check_permit_expirations(self) -> None:
-        """Alert on permits nearing or past expiration."""
+    def _check_permit_expirations(
+        self, order_ids: List[int], docs: Dict[int, Dict[str, Any]]
+    ) -> None:
+        """Alert on permits nearing or past expiration.
+
+        Args:
+            order_ids: The user's current order IDs.
+            docs: Order documents for this cycle, keyed by order ID.
+        """
         try:
-            db = get_db()
-            order_ids = self._get_user_order_ids()
             now = datetime.now()
 
             for oid in order_ids:
-                doc = db.orders.find_one({"id": oid})
+                doc = docs.get(oid)
                 if not doc:
                     continue
 
@@ -306,7 +485,7 @@ class ProactiveMonitor:
 
                 for state_entry in route_data:
                     state_name = state_entry.get("product_name", "Unknown")
-                    permit_key = f"{oid}_{state_name}"
+                    permit_key = (oid, state_name)
 
                     if permit_key in self._warned_permits:
                         continue
@@ -315,63 +494,62 @@ class ProactiveMonitor:
                     attached_at = state_entry.get("attached_at")
                     permit_status = state_entry.get("permit_status", "")
 
-                    # Check if permit has an expiry indicator
+                    # Typical permits valid for 5-10 days; estimate from attached_at
+                    days_until_expiry: Optional[int] = None
                     if attached_at:
-                        try:
-                            attach_date = self._parse_date(attached_at)
-                            if attach_date:
-                                # Typical permits valid for 5-10 days
+                        attach_date = self._parse_date_cached(oid, attached_at)
+                        if attach_date:
+                            try:
                                 estimated_expiry = attach_date + timedelta(days=7)
                                 days_until_expiry = (estimated_expiry - now).days
+                            except (OverflowError, TypeError):
+                                pass
 
-                                if days_until_expiry < 0:
-                                    alert = ProactiveAlert(
-                                        alert_type="permit_expired",
-                                        priority=AlertPriority.CRITICAL,
-                                        title=f"Permit expired: {state_name}",
-                                        message=(
-                                            f"Alert! The permit for {state_name} "
-                                            f"on order {oid} appears to have expired "
-                                            f"{abs(days_until_expiry)} days ago. "
-                                            f"Please verify and renew if needed."
-                                        ),
-                                        order_id=oid,
-                                        metadata={
-                                            "state": state_name,
-                                            "days_expired": abs(days_until_expiry),
-                                        },
-                                    )
-                                    self._enqueue_alert(alert)
-                                    self._warned_permits.add(permit_key)
-
-                                elif days_until_expiry <= self.permit_warning_days:
-                                    alert = ProactiveAlert(
-                                        alert_type="permit_expiring",
-                                        priority=AlertPriority.HIGH,
-                                        title=f"Permit expiring: {state_name}",
-                                        message=(
-                                            f"Reminder: The permit for {state_name} "
-                                            f"on order {oid} is expiring in "
-                                            f"{days_until_expiry} day{'s' if days_until_expiry != 1 else ''}. "
-                                            f"Please ensure it's renewed on time."
-                                        ),
-                                        order_id=oid,
-                                        metadata={
-                                            "state": state_name,
-                                            "days_remaining": days_until_expiry,
-                                        },
-                                    )
-                                    self._enqueue_alert(alert)
-                                    self._warned_permits.add(permit_key)
-                        except Exception:
-                            pass
+                    if days_until_expiry is not None and days_until_expiry < 0:
+                        alert = ProactiveAlert(
+                            alert_type="permit_expired",
+                            priority=AlertPriority.CRITICAL,
+                            title=f"Permit expired: {state_name}",
+                            message=(
+                                f"Alert! The permit for {state_name} "
+                                f"on order {oid} appears to have expired "
+                                f"{abs(days_until_expiry)} days ago. "
+                                f"Please verify and renew if needed."
+                            ),
+                            order_id=oid,
+                            metadata={
+                                "state": state_name,
+                                "days_expired": abs(days_until_expiry),
+                            },
+                        )
+                        self._enqueue_alert(alert)
+                        self._warned_permits.add(permit_key)
 
-                    # Also alert if permit status indicates an issue
-                    if permit_status and permit_status.lower() in (
-                        "expired",
-                        "rejected",
-                        "cancelled",
+                    elif (
+                        days_until_expiry is not None
+                        and days_until_expiry <= self.permit_warning_days
                     ):
+                        alert = ProactiveAlert(
+                            alert_type="permit_expiring",
+                            priority=AlertPriority.HIGH,
+                            title=f"Permit expiring: {state_name}",
+                            message=(
+                                f"Reminder: The permit for {state_name} "
+                                f"on order {oid} is expiring in "
+                                f"{days_until_expiry} day{'s' if days_until_expiry != 1 else ''}. "
+                                f"Please ensure it's renewed on time."
+                            ),
+                            order_id=oid,
+                            metadata={
+                                "state": state_name,
+                                "days_remaining": days_until_expiry,
+                            },
+                        )
+                        self._enqueue_alert(alert)
+                        self._warned_permits.add(permit_key)
+
+                    # Also alert if permit status indicates an issue
+                    if permit_status and permit_status.lower() in self._BAD_PERMIT_STATUSES:
                         if permit_key not in self._warned_permits:
                             alert = ProactiveAlert(
                                 alert_type="permit_issue",
@@ -396,18 +574,23 @@ class ProactiveMonitor:
 
     # ─── Delivery Deadlines ───────────────────────────────────────────────
 
-    async def _check_delivery_deadlines(self) -> None:
-        """Alert on deliveries with approaching deadlines."""
+    def _check_delivery_deadlines(
+        self, order_ids: List[int], docs: Dict[int, Dict[str, Any]]
+    ) -> None:
+        """Alert on deliveries with approaching deadlines.
+
+        Args:
+            order_ids: The user's current order IDs.
+            docs: Order documents for this cycle, keyed by order ID.
+        """
         try:
-            db = get_db()
-            order_ids = self._get_user_order_ids()
             now = datetime.now()
 
             for oid in order_ids:
                 if oid in self._warned_deadlines:
                     continue
 
-                doc = db.orders.find_one({"id": oid})
+                doc = docs.get(oid)
                 if not doc:
                     continue
 
@@ -419,7 +602,7 @@ class ProactiveMonitor:
                     if not date_val:
                         continue
 
-                    deadline = self._parse_date(date_val)
+                    deadline = self._parse_date_cached(oid, date_val)
                     if not deadline:
                         continue
 
@@ -481,11 +664,14 @@ class ProactiveMonitor:
     async def _check_route_weather(self) -> None:
         """Check for severe weather along active order routes."""
         try:
-            db = get_db()
-            order_ids = self._get_user_order_ids()
+            order_ids = await self._get_user_order_ids()
+            if order_ids is None:
+                return
+            docs = await self._fetch_orders(order_ids, self._WEATHER_PROJECTION)
 
+            route_cities: List[Tuple[int, Set[str]]] = []
             for oid in order_ids:
-                doc = db.orders.find_one({"id": oid})
+                doc = docs.get(oid)
                 if not doc:
                     continue
 
@@ -496,93 +682,172 @@ class ProactiveMonitor:
 
                 order_data = doc.get("order", {})
 
-                # Extract route cities from origin/destination or route data
-                cities = set()
-                for field_name in ("origin_city", "pickup_city", "from_city"):
-                    city = order_data.get(field_name)
-                    if city and isinstance(city, str):
-                        cities.add(city.strip())
-
-                for field_name in ("destination_city", "delivery_city", "to_city"):
-                    city = order_data.get(field_name)
-                    if city and isinstance(city, str):
-                        cities.add(city.strip())
-
-                # Also check route states for major cities
+                # Route cities from origin/destination fields plus route states
                 route_data = order_data.get("routeData", [])
-                if isinstance(route_data, list):
-                    for state_entry in route_data:
-                        state_name = state_entry.get("product_name", "")
-                        if state_name:
-                            cities.add(state_name)
+                if not isinstance(route_data, list):
+                    route_data = ()
+                cities = {
+                    city.strip()
+                    for field_name in self._ROUTE_CITY_FIELDS
+                    if (city := order_data.get(field_name)) and isinstance(city, str)
+                } | {
+                    state_name
+                    for state_entry in route_data
+                    if (state_name := state_entry.get("product_name", ""))
+                }
+                cities = {
+                    city for city in cities
+                    if ("weather", oid, city) not in self._delivered_keys
+                }
+                if cities:
+                    route_cities.append((oid, cities))
+
+            # Look up each city once, concurrently, across all orders
+            unique_cities = sorted(set().union(*(c for _, c in route_cities)))
+            results = await asyncio.gather(
+                *(
+                    asyncio.to_thread(get_weather_by_city, city)
+                    for city in unique_cities
+                ),
+                return_exceptions=True,
+            )
+            weather_by_city = dict(zip(unique_cities, results))
 
-                # Check weather for each unique city
+            for oid, cities in route_cities:
                 for city in cities:
-                    weather_key = f"weather_{oid}_{city}"
-                    if weather_key in self._delivered_keys:
-                        continue
+                    weather_info = weather_by_city.get(city)
+                    if isinstance(weather_info, Exception):
+                        continue  # Weather API failures shouldn't crash monitoring
 
-                    try:
-                        weather_info = get_weather_by_city(city)
-                        if weather_info and self._is_severe_weather(weather_info):
-                            alert = ProactiveAlert(
-                                alert_type="weather_alert",
-                                priority=AlertPriority.CRITICAL,
-                                title=f"Severe weather: {city}",
-                                message=(
-                                    f"Weather alert for your route! "
-                                    f"Severe conditions detected near {city} "
-                                    f"on order {oid}. {weather_info} "
-                                    f"Please exercise caution."
-                                ),
-                                order_id=oid,
-                                metadata={
-                                    "city": city,
-                                    "weather": weather_info,
-                                },
-                            )
-                            self._enqueue_alert(alert)
-                            self._delivered_keys.add(weather_key)
-                    except Exception:
-                        pass  # Weather API failures shouldn't crash monitoring
+                    if weather_info and self._is_severe_weather(weather_info):
+                        alert = ProactiveAlert(
+                            alert_type="weather_alert",
+                            priority=AlertPriority.CRITICAL,
+                            title=f"Severe weather: {city}",
+                            message=(
+                                f"Weather alert for your route! "
+                                f"Severe conditions detected near {city} "
+                                f"on order {oid}. {weather_info} "
+                                f"Please exercise caution."
+                            ),
+                            order_id=oid,
+                            metadata={
+                                "city": city,
+                                "weather": weather_info,
+                            },
+                        )
+                        self._enqueue_alert(alert)
+                        self._delivered_keys.add(("weather", oid, city))
 
         except Exception as e:
             logger.error("Error checking route weather: %s", e)
 
     # ─── Helper Methods ───────────────────────────────────────────────────
 
-    def _get_user_order_ids(self) -> List[int]:
-        """Get the list of order IDs for the current user."""
-        try:
-            db = get_db()
-
-            if self.user_role == "admin":
-                # Admins: return limited recent orders
-                cursor = (
-                    db.orders.find({}, {"id": 1})
-                    .sort("id", -1)
-                    .limit(20)
-                )
-                return [doc["id"] for doc in cursor if "id" in doc]
+    async def _run_blocking(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking call on the monitor's dedicated worker threads.
 
-            elif self.user_role == "driver":
-                user_doc = db.drivers.find_one({"email": self.user_email})
-                return user_doc.get("order_ids", []) if user_doc else []
+        The monitor keeps its own small pool so its MongoDB polling does not
+        compete with the rest of the app for the default executor.
 
-            elif self.user_role == "client":
-                user_doc = db.clients.find_one({"email": self.user_email})
-                return user_doc.get("order_ids", []) if user_doc else []
+        Args:
+            func: Blocking callable to run.
+            *args: Positional arguments for ``func``.
 
-            return []
+        Returns:
+            The callable's return value.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="proactive-mon"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
 
-        except Exception as e:
-            logger.error("Error getting user order IDs: %s", e)
-            return []
+    async def _get_user_order_ids(self) -> Optional[List[int]]:
+        """Get the list of order IDs for the current user.
+
+        The list is cached for ``_ORDER_IDS_TTL`` seconds so the checkers in
+        one cycle share a single lookup.
+
+        Returns:
+            The user's order IDs, or None if the lookup failed.
+        """
+        async with self._order_ids_lock:
+            if self._order_ids_cache is not None:
+                cached_at, order_ids = self._order_ids_cache
+                if time.monotonic() - cached_at < self._ORDER_IDS_TTL:
+                    return order_ids
+
+            try:
+                order_ids = await self._run_blocking(self._load_user_order_ids)
+            except Exception as e:
+                logger.error("Error getting user order IDs: %s", e)
+                return None
+
+            self._order_ids_cache = (time.monotonic(), order_ids)
+            return order_ids
+
+    def _load_user_order_ids(self) -> List[int]:
+        """Query MongoDB for the current user's order IDs (blocking)."""
+        if self.user_role == "admin":
+            # Admins: return limited recent orders
+            cursor = (
+                self._orders.find({}, {"id": 1, "_id": 0})
+                .sort("id", -1)
+                .limit(20)
+            )
+            return [doc["id"] for doc in cursor if "id" in doc]
+
+        elif self.user_role == "driver":
+            user_doc = self._drivers.find_one(
+                {"email": self.user_email}, self._USER_ORDER_IDS_PROJECTION
+            )
+            return user_doc.get("order_ids", []) if user_doc else []
+
+        elif self.user_role == "client":
+            user_doc = self._clients.find_one(
+                {"email": self.user_email}, self._USER_ORDER_IDS_PROJECTION
+            )
+            return user_doc.get("order_ids", []) if user_doc else []
+
+        return []
+
+    async def _fetch_orders(
+        self,
+        order_ids: List[int],
+        projection: Optional[Dict[str, int]] = None,
+    ) -> Dict[int, Dict[str, Any]]:
+        """Fetch order documents for the given IDs in a single query.
+
+        The query runs on the monitor's worker threads so it does not block
+        the event loop.
+
+        Args:
+            order_ids: Order IDs to fetch.
+            projection: Fields to return. Defaults to the full document.
+
+        Returns:
+            Mapping of order ID to order document.
+        """
+        if not order_ids:
+            return {}
+
+        return await self._run_blocking(self._find_orders, list(order_ids), projection)
+
+    def _find_orders(
+        self,
+        order_ids: List[int],
+        projection: Optional[Dict[str, int]],
+    ) -> Dict[int, Dict[str, Any]]:
+        """Run the batched order query and index the results (blocking)."""
+        cursor = self._orders.find({"id": {"$in": order_ids}}, projection)
+        return {doc["id"]: doc for doc in cursor if "id" in doc}
 
     def _extract_order_status(self, doc: Dict[str, Any]) -> str:
         """Extract the status string from an order document."""
         order_data = doc.get("order", {})
-        for status_field in ("status", "order_status", "orderStatus", "state"):
+        for status_field in self._STATUS_FIELDS:
             val = order_data.get(status_field)
             if val and isinstance(val, str):
                 return val
@@ -596,18 +861,13 @@ class ProactiveMonitor:
         if not isinstance(date_val, str):
             return None
 
-        formats = [
-            "%Y-%m-%dT%H:%M:%S.%fZ",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d",
-            "%m/%d/%Y",
-            "%m/%d/%Y %H:%M:%S",
-            "%d-%m-%Y",
-            "%B %d, %Y",
-        ]
-        for fmt in formats:
+        # ISO 8601 covers most stored values; keep results naive
+        try:
+            return datetime.fromisoformat(date_val).replace(tzinfo=None)
+        except ValueError:
+            pass
+
+        for fmt in self._DATE_FORMATS:
             try:
                 return datetime.strptime(date_val, fmt)
             except ValueError:
@@ -615,27 +875,41 @@ class ProactiveMonitor:
 
         return None
 
+    def _parse_date_cached(self, oid: int, date_val: Any) -> Optional[datetime]:
+        """Parse a date value, reusing earlier results for the same order.
+
+        Args:
+            oid: Order ID the value belongs to.
+            date_val: Raw date value from the order document.
+
+        Returns:
+            The parsed datetime, or None if it could not be parsed.
+        """
+        if not isinstance(date_val, str):
+            return self._parse_date(date_val)
+
+        key = (oid, date_val)
+        if key not in self._date_cache:
+            self._date_cache[key] = self._parse_date(date_val)
+        return self._date_cache[key]
+
     def _is_severe_weather(self, weather_info: str) -> bool:
         """Check if a weather description indicates severe conditions."""
-        severe_keywords = (
-            "storm", "thunderstorm", "tornado", "hurricane",
-            "blizzard", "heavy rain", "heavy snow", "ice",
-            "freezing rain", "hail", "flood", "warning",
-            "extreme", "severe", "dangerous", "advisory",
-            "high wind", "gale", "fog",
-        )
-        info_lower = weather_info.lower()
-        return any(keyword in info_lower for keyword in severe_keywords)
-
-    def _alert_key(self, alert: ProactiveAlert) -> str:
-        """Generate a deduplication key for an alert."""
-        return f"{alert.alert_type}_{alert.order_id}_{alert.title}"
+        return self._SEVERE_WEATHER_RE.search(weather_info.lower()) is not None
 
     def _enqueue_alert(self, alert: ProactiveAlert) -> None:
         """Add an alert to the queue if not already delivered."""
-        key = self._alert_key(alert)
-        if key not in self._delivered_keys:
-            self.alert_queue.append(alert)
+        if alert.key not in self._delivered_keys:
+            heapq.heappush(
+                self._alert_heap,
+                (
+                    alert.priority,
+                    alert.created_at,
+                    next(self._alert_seq),
+                    alert,
+                ),
+            )
+            self._summary_cache = None
             logger.info(
                 "Proactive alert queued: [%s] %s",
                 alert.priority.name,
@@ -654,6 +928,11 @@ class ProactiveMonitor:
         if not pending:
             return None
 
+        # Reuse the last summary while the summarized alerts are unchanged
+        signature = (len(pending), tuple(alert.key for alert in pending[:5]))
+        if self._summary_cache is not None and self._summary_cache[0] == signature:
+            return self._summary_cache[1]
+
         # Build alert descriptions for the LLM
         alert_descriptions = []
         for i, alert in enumerate(pending[:5], 1):  # Max 5 alerts at a time
@@ -683,7 +962,11 @@ class ProactiveMonitor:
         try:
             llm = get_llm()
             summary = llm.chat(messages, max_tokens=200)
-            return summary.strip() if summary else None
+            if not summary:
+                return None
+            summary = summary.strip()
+            self._summary_cache = (signature, summary)
+            return summary
         except Exception as e:
             logger.error("Error generating proactive summary: %s", e)
             # Fallback: return the highest priority alert directly
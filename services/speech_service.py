@@ -6,22 +6,37 @@ and speech-to-text using Google Speech Recognition.
 """
 
 import asyncio
+import atexit
+import hashlib
+import io
 import logging
 import os
 import shutil
 import threading
 import time
+import uuid
 from queue import Queue
-from typing import Optional
+from typing import Dict, Optional, Union
 
 import edge_tts
 import pygame
 import speech_recognition as sr
 
+from config.constants import STATIC_TTS_PHRASES
 from config.settings import settings
+from utils.text import split_sentences
 
 logger = logging.getLogger(__name__)
 
+# A playable mp3: a file path or an in-memory buffer
+AudioSource = Union[str, io.BytesIO]
+
+# Subdirectory of the stream audio dir holding the persistent TTS cache
+TTS_CACHE_DIRNAME = "cache"
+
+# Only these fixed phrases are persisted; dynamic text is never cached
+_CACHEABLE_PHRASES = frozenset(STATIC_TTS_PHRASES)
+
 
 class SpeechSynthesizer:
     """Text-to-speech engine using edge-tts and pygame.
@@ -30,6 +45,8 @@ class SpeechSynthesizer:
     for smooth sentence-by-sentence audio output.
     """
 
+    MAX_CONCURRENT_SYNTHESIS = 3
+
     def __init__(self, voice: Optional[str] = None) -> None:
         """Initialize the speech synthesizer.
 
@@ -38,16 +55,17 @@ class SpeechSynthesizer:
         """
         self.voice = voice or settings.speech.tts_voice
         self.stream_folder = settings.speech.stream_audio_dir
+        self.cache_folder = os.path.join(self.stream_folder, TTS_CACHE_DIRNAME)
         self._audio_queue: Queue = Queue()
+        self._mixer_lock = threading.Lock()
 
-        os.makedirs(self.stream_folder, exist_ok=True)
+        # Bounds concurrent edge-tts requests to respect its rate limits
+        self._synthesis_slots = asyncio.Semaphore(self.MAX_CONCURRENT_SYNTHESIS)
 
-        try:
-            if not pygame.mixer.get_init():
-                pygame.mixer.init(frequency=settings.speech.audio_frequency)
-        except pygame.error as e:
-            logger.error("Failed to initialize pygame mixer: %s", e)
-            raise
+        # Decoded audio for STATIC_TTS_PHRASES, loaded on first playback
+        self._static_sounds: Dict[str, pygame.mixer.Sound] = {}
+
+        os.makedirs(self.cache_folder, exist_ok=True)
 
         # Start background playback thread
         self._playback_thread = threading.Thread(
@@ -56,50 +74,195 @@ class SpeechSynthesizer:
         )
         self._playback_thread.start()
 
+    def _ensure_mixer(self) -> None:
+        """Initialize the pygame mixer on first playback.
+
+        The mixer is started lazily so sessions that never speak do not pay
+        for an idle audio device. A larger buffer trades a few milliseconds
+        of latency for fewer callbacks while playing short clips back to back.
+
+        Raises:
+            pygame.error: If the audio device cannot be opened.
+        """
+        with self._mixer_lock:
+            if pygame.mixer.get_init():
+                return
+            try:
+                pygame.mixer.pre_init(
+                    frequency=settings.speech.audio_frequency,
+                    buffer=settings.speech.audio_buffer_size,
+                )
+                pygame.mixer.init()
+            except pygame.error as e:
+                logger.error("Failed to initialize pygame mixer: %s", e)
+                raise
+
+    def _cache_path(self, text: str) -> str:
+        """Return the cache file path for text spoken in the current voice."""
+        key = hashlib.sha1(f"{self.voice}|{text}".encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_folder, f"{key}.mp3")
+
+    @staticmethod
+    def _write_cache(cache_path: str, data: bytes) -> None:
+        """Atomically write synthesized audio to the cache (blocking)."""
+        # Write under a temporary name so the cache never holds a partial file
+        temp_file = f"{cache_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(temp_file, "wb") as f:
+                f.write(data)
+            os.replace(temp_file, cache_path)
+        except OSError as e:
+            logger.warning("Could not cache speech audio: %s", e)
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+
+    async def _synthesize(self, text: str) -> AudioSource:
+        """Synthesize text to mp3 audio.
+
+        Phrases in ``STATIC_TTS_PHRASES`` are cached on disk and reused;
+        all other text is synthesized into memory and never persisted.
+
+        Args:
+            text: The text to synthesize.
+
+        Returns:
+            Path to the cached mp3, or an in-memory mp3 buffer.
+        """
+        cache_path = self._cache_path(text) if text in _CACHEABLE_PHRASES else None
+        if cache_path is not None and os.path.exists(cache_path):
+            return cache_path
+
+        buffer = io.BytesIO()
+        async with self._synthesis_slots:
+            communicate = edge_tts.Communicate(text, self.voice)
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    buffer.write(chunk["data"])
+
+        if cache_path is not None:
+            await asyncio.to_thread(self._write_cache, cache_path, buffer.getvalue())
+
+        buffer.seek(0)
+        return buffer
+
+    def synthesize(self, text: str) -> "asyncio.Task[AudioSource]":
+        """Start synthesizing text in the background.
+
+        At most ``MAX_CONCURRENT_SYNTHESIS`` syntheses run at once. Pass the
+        awaited result to ``queue_audio`` to play it.
+
+        Args:
+            text: The text to synthesize.
+
+        Returns:
+            A task resolving to the playable audio.
+        """
+        return asyncio.create_task(self._synthesize(text))
+
+    async def prewarm(self) -> None:
+        """Synthesize the static phrases into the disk cache ahead of first use.
+
+        Only the cache is filled here; the mixer is still opened and each
+        clip decoded on first playback.
+        """
+        results = await asyncio.gather(
+            *(self._synthesize(phrase) for phrase in STATIC_TTS_PHRASES),
+            return_exceptions=True,
+        )
+        for phrase, result in zip(STATIC_TTS_PHRASES, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning("Could not prewarm phrase %r: %s", phrase, result)
+
+    def _static_sound(self, text: str) -> Optional[pygame.mixer.Sound]:
+        """Return the decoded clip for a cached static phrase, if available.
+
+        The clip is decoded from the disk cache on first use and kept in
+        memory afterwards.
+
+        Args:
+            text: The text about to be spoken.
+
+        Returns:
+            The decoded clip, or None if the text is not a cached static phrase.
+        """
+        if text not in _CACHEABLE_PHRASES:
+            return None
+        sound = self._static_sound(text)
+        if sound is not None:
+            return sound
+
+        cache_path = self._cache_path(text)
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            self._ensure_mixer()
+            sound = pygame.mixer.Sound(cache_path)
+        except pygame.error as e:
+            logger.warning("Could not load audio for %r: %s", text, e)
+            return None
+        self._static_sounds[text] = sound
+        return sound
+
     async def text_to_speech(self, text: str) -> None:
         """Convert text to speech and play it.
 
+        Static phrases are cached on disk per voice and, after their first
+        playback, play straight from memory.
+        Longer text is spoken sentence by sentence, synthesizing the next
+        sentence while the current one plays.
+
         Args:
             text: The text to speak.
         """
         if not text or not text.strip():
             return
 
-        try:
-            temp_file = os.path.join(
-                self.stream_folder,
-                f"tts_{hash(text + str(time.time()))}.mp3",
-            )
-            communicate = edge_tts.Communicate(text, self.voice)
-            await communicate.save(temp_file)
-
-            if not pygame.mixer.get_init():
-                pygame.mixer.init(frequency=settings.speech.audio_frequency)
+        sound = self._static_sounds.get(text)
+        if sound is not None:
+            channel = sound.play()
+            # The clip length is known up front, so sleep through it instead
+            # of polling from the start
+            await asyncio.sleep(sound.get_length())
+            while channel is not None and channel.get_busy():
+                await asyncio.sleep(0.01)
+            return
 
-            pygame.mixer.music.load(temp_file)
-            pygame.mixer.music.play()
+        segments = [s for s in split_sentences(text) if s.strip()] or [text]
+        pending: Optional[asyncio.Task] = asyncio.create_task(
+            self._synthesize(segments[0])
+        )
+        try:
+            for index in range(len(segments)):
+                audio = await pending
+                pending = None
+                if index + 1 < len(segments):
+                    pending = asyncio.create_task(
+                        self._synthesize(segments[index + 1])
+                    )
+
+                self._ensure_mixer()
+                pygame.mixer.music.load(audio)
+                pygame.mixer.music.play()
 
-            while pygame.mixer.music.get_busy():
-                await asyncio.sleep(0.1)
+                while pygame.mixer.music.get_busy():
+                    await asyncio.sleep(0.1)
 
-            pygame.mixer.music.unload()
+                pygame.mixer.music.unload()
 
         except Exception as e:
             logger.error("Error in text_to_speech: %s", e)
         finally:
-            try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-            except Exception:
-                pass
+            if pending is not None:
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
 
-    def queue_audio(self, filename: str) -> None:
-        """Add an audio file to the playback queue.
+    def queue_audio(self, audio: AudioSource) -> None:
+        """Add audio to the playback queue.
 
         Args:
-            filename: Path to the audio file.
+            audio: Path to an audio file, or an in-memory mp3 buffer.
         """
-        self._audio_queue.put(filename)
+        self._audio_queue.put(audio)
 
     def wait_for_playback_completion(self) -> None:
         """Block until all queued audio has finished playing."""
@@ -107,30 +270,38 @@ class SpeechSynthesizer:
 
     def _audio_playback_handler(self) -> None:
         """Background thread handler for queued audio playback."""
+        clock = pygame.time.Clock()
         while True:
-            filename = self._audio_queue.get()
-            if filename is None:
+            audio = self._audio_queue.get()
+            if audio is None:
                 break
 
-            if not os.path.exists(filename):
-                logger.warning("Audio file not found: %s", filename)
+            is_file = isinstance(audio, str)
+            if is_file and not os.path.exists(audio):
+                logger.warning("Audio file not found: %s", audio)
                 self._audio_queue.task_done()
                 continue
 
             try:
-                pygame.mixer.music.load(filename)
+                self._ensure_mixer()
+                pygame.mixer.music.load(audio)
                 pygame.mixer.music.play()
                 while pygame.mixer.music.get_busy():
-                    pygame.time.Clock().tick(10)
+                    clock.tick(10)
                 pygame.mixer.music.unload()
                 time.sleep(0.01)
             except Exception as e:
-                logger.error("Playback error for %s: %s", filename, e)
+                logger.error("Playback error for %s: %s", audio, e)
             finally:
                 self._audio_queue.task_done()
                 try:
-                    if os.path.exists(filename):
-                        os.remove(filename)
+                    # Cached audio is kept for reuse
+                    if (
+                        is_file
+                        and os.path.dirname(audio) != self.cache_folder
+                        and os.path.exists(audio)
+                    ):
+                        os.remove(audio)
                 except Exception:
                     pass
 
@@ -141,7 +312,7 @@ class SpeechSynthesizer:
             pygame.mixer.music.unload()
         except Exception:
             pass
-        delete_stream_audio_files(self.stream_folder)
+        await asyncio.to_thread(delete_stream_audio_files, self.stream_folder)
         self._audio_queue.put(None)
         if self._playback_thread.is_alive():
             self._playback_thread.join(timeout=1)
@@ -164,6 +335,40 @@ def create_recognizer() -> sr.Recognizer:
 
 _recognizer = create_recognizer()
 
+# Microphone kept open across take_command() calls, opened on first use
+_microphone: Optional[sr.Microphone] = None
+
+
+def _open_microphone() -> sr.Microphone:
+    """Return the shared microphone with its input stream open.
+
+    Audio captured while nobody was listening is discarded so each
+    listen starts from live input.
+    """
+    global _microphone
+    if _microphone is None:
+        microphone = sr.Microphone()
+        microphone.__enter__()
+        _microphone = microphone
+    else:
+        stream = _microphone.stream.pyaudio_stream
+        available = stream.get_read_available()
+        if available:
+            stream.read(available, exception_on_overflow=False)
+    return _microphone
+
+
+@atexit.register
+def _close_microphone() -> None:
+    """Close the shared microphone stream, if open."""
+    global _microphone
+    if _microphone is not None:
+        microphone, _microphone = _microphone, None
+        try:
+            microphone.__exit__(None, None, None)
+        except Exception as e:
+            logger.debug("Error closing microphone: %s", e)
+
 
 async def take_command() -> str:
     """Listen for voice input and return recognized text.
@@ -172,28 +377,36 @@ async def take_command() -> str:
         Recognized text in lowercase, or 'none' if recognition fails.
     """
     try:
-        with sr.Microphone() as source:
-            logger.debug("Listening...")
-            print("\nListening...")
-            audio = _recognizer.listen(
-                source,
-                timeout=settings.speech.listen_timeout,
-                phrase_time_limit=settings.speech.phrase_time_limit,
-            )
-
-            logger.debug("Recognizing...")
-            print("Recognizing...")
-            query = _recognizer.recognize_google(audio, language="en-US")
-            print(f"You said: {query}")
-            return query.lower()
+        # Capture and recognition both block, so run them off the event loop
+        source = await asyncio.to_thread(_open_microphone)
+        logger.debug("Listening...")
+        print("\nListening...")
+        audio = await asyncio.to_thread(
+            _recognizer.listen,
+            source,
+            timeout=settings.speech.listen_timeout,
+            phrase_time_limit=settings.speech.phrase_time_limit,
+        )
+
+        logger.debug("Recognizing...")
+        print("Recognizing...")
+        query = await asyncio.to_thread(
+            _recognizer.recognize_google, audio, language="en-US"
+        )
+        print(f"You said: {query}")
+        return query.lower()
 
     except sr.UnknownValueError:
         return "none"
+    except sr.WaitTimeoutError:
+        return "none"
     except sr.RequestError as e:
         logger.error("Speech recognition request error: %s", e)
         return "none"
     except Exception as e:
         logger.error("Error in speech recognition: %s", e)
+        # Reopen the device on the next call in case the stream broke
+        _close_microphone()
         return "none"
 
 
@@ -202,24 +415,30 @@ def delete_stream_audio_files(
 ) -> None:
     """Remove all files from the stream audio directory.
 
+    The persistent TTS cache subdirectory is left in place.
+
     Args:
         folder_path: Directory to clean. Defaults to config setting.
     """
     folder = folder_path or settings.speech.stream_audio_dir
-    if not os.path.exists(folder):
+    try:
+        entries = os.scandir(folder)
+    except FileNotFoundError:
         return
 
-    for filename in os.listdir(folder):
-        filepath = os.path.join(folder, filename)
-        try:
-            if os.path.isfile(filepath):
-                try:
-                    os.remove(filepath)
-                except PermissionError:
-                    pygame.mixer.music.unload()
-                    time.sleep(0.1)
-                    os.remove(filepath)
-            elif os.path.isdir(filepath):
-                shutil.rmtree(filepath)
-        except Exception as e:
-            logger.error("Error deleting %s: %s", filepath, e)
+    with entries:
+        for entry in entries:
+            if entry.name == TTS_CACHE_DIRNAME:
+                continue
+            try:
+                if entry.is_file(follow_symlinks=False):
+                    try:
+                        os.remove(entry.path)
+                    except PermissionError:
+                        pygame.mixer.music.unload()
+                        time.sleep(0.1)
+                        os.remove(entry.path)
+                elif entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+            except Exception as e:
+                logger.error("Error deleting %s: %s", entry.path, e)
@@ -7,50 +7,135 @@ and legal requirements for heavy haul transportation.
 
 import asyncio
 import logging
-from typing import Optional
+import re
+from typing import Any, Dict, List, Optional
 
-from config.constants import (
-    ORDER_SWITCH_KEYWORDS,
-    PERMIT_SWITCH_KEYWORDS,
-    PROVISION_KEYWORDS,
-    STATES,
-)
+from config.constants import PERMIT_SWITCH_KEYWORDS, PROVISION_KEYWORDS
 from config.settings import settings
 from db import get_db
 from services.llm_client import get_llm
-from services.speech_service import SpeechSynthesizer, take_command
-from utils.text import split_sentences
+from services.speech_service import AudioSource, SpeechSynthesizer, take_command
+from utils.text import (
+    ORDER_SWITCH_RE,
+    compile_keyword_pattern,
+    find_state_name,
+    split_sentences,
+)
 
 logger = logging.getLogger(__name__)
 
+# Precompiled matchers for per-turn intent dispatch
+_PERMIT_SWITCH_RE = compile_keyword_pattern(PERMIT_SWITCH_KEYWORDS)
+
+# Set once ensure_state_name_index() has backfilled every state document
+_state_names_backfilled = False
+
+
+def ensure_state_name_index() -> None:
+    """Backfill the canonical ``state_name_lc`` field and index it (blocking).
+
+    Run once at startup, off the event loop. Safe to call repeatedly; only
+    documents missing the field are updated and ``create_index`` is a no-op
+    once the index exists.
+    """
+    global _state_names_backfilled
+    db = get_db()
+    db.states.update_many(
+        {"state_name_lc": {"$exists": False}},
+        [{"$set": {"state_name_lc": {"$toLower": "$state_name"}}}],
+    )
+    db.states.create_index("state_name_lc", unique=True)
+    _state_names_backfilled = True
+
+
+def _find_state_doc(states_collection: Any, state_name: str) -> Optional[Dict[str, Any]]:
+    """Look up a state document by its canonical lowercase name.
 
-def find_state_in_query(query: str) -> Optional[str]:
+    Until the backfill has succeeded, falls back to a case-insensitive
+    regex for documents that may predate the ``state_name_lc`` field.
+
+    Args:
+        states_collection: The states MongoDB collection.
+        state_name: State name to look up.
+
+    Returns:
+        The state document, or None if not found.
+    """
+    doc = states_collection.find_one({"state_name_lc": state_name.lower()})
+    if doc is None and not _state_names_backfilled:
+        doc = states_collection.find_one(
+            {"state_name": {"$regex": f"^{re.escape(state_name)}$", "$options": "i"}}
+        )
+    return doc
+
+
+def find_state_in_query(
+    query: str, query_lower: Optional[str] = None
+) -> Optional[str]:
     """Detect a state name mentioned in a query.
 
     Args:
         query: The user's query text.
+        query_lower: Pre-lowercased query, if the caller already has one.
 
     Returns:
         The matched state name, or None.
     """
-    query_lower = query.lower()
-    for state in STATES:
-        if state.lower() in query_lower:
-            return state
-    return None
+    if query_lower is None:
+        query_lower = query.lower()
+    return find_state_name(query_lower)
 
 
-def _should_switch_to_orders(query: str) -> bool:
+async def _queue_in_order(
+    speech_synthesizer: SpeechSynthesizer,
+    ordered: "asyncio.Queue[Optional[asyncio.Task[AudioSource]]]",
+) -> None:
+    """Queue synthesized sentences for playback in the order they started.
+
+    Args:
+        speech_synthesizer: TTS engine that plays the audio.
+        ordered: Synthesis tasks in speaking order, ended by None.
+    """
+    while (task := await ordered.get()) is not None:
+        try:
+            audio = await task
+        except Exception as e:
+            # Skip the failed sentence rather than dropping the rest
+            logger.error("Speech synthesis failed, skipping sentence: %s", e)
+            continue
+        speech_synthesizer.queue_audio(audio)
+
+
+def _speak_sentence(
+    speech_synthesizer: SpeechSynthesizer,
+    sentence: str,
+    tasks: "List[asyncio.Task[AudioSource]]",
+    ordered: "asyncio.Queue[Optional[asyncio.Task[AudioSource]]]",
+) -> None:
+    """Start synthesizing a sentence and queue it for ordered playback.
+
+    Args:
+        speech_synthesizer: TTS engine that synthesizes the audio.
+        sentence: Sentence to speak; empty strings are ignored.
+        tasks: Synthesis tasks started so far, cancelled on exit.
+        ordered: Synthesis tasks in speaking order.
+    """
+    if sentence:
+        task = speech_synthesizer.synthesize(sentence)
+        tasks.append(task)
+        ordered.put_nowait(task)
+
+
+def _should_switch_to_orders(query_lower: str) -> bool:
     """Check if the query indicates switching to order system.
 
     Args:
-        query: The user's query text.
+        query_lower: The user's query text, lowercased.
 
     Returns:
         True if the query contains order-switching keywords.
     """
-    query_lower = query.lower()
-    return any(keyword in query_lower for keyword in ORDER_SWITCH_KEYWORDS)
+    return ORDER_SWITCH_RE.search(query_lower) is not None
 
 
 async def get_state_info(
@@ -79,19 +164,20 @@ async def get_state_info(
             print("\nListening for your question...")
             query = await take_command()
 
-        if query.lower() in ("quit", "exit", "none"):
+        query_lower = query.lower()
+        if query_lower in ("quit", "exit", "none"):
             break
 
         # Check for system switching
-        if _should_switch_to_orders(query):
+        if _should_switch_to_orders(query_lower):
             await speech_synthesizer.text_to_speech("Switching back to order system...")
             return "orders"
 
-        if any(kw in query.lower() for kw in PERMIT_SWITCH_KEYWORDS):
+        if _PERMIT_SWITCH_RE.search(query_lower):
             return "permits"
 
         # Detect state in query
-        state_in_query = find_state_in_query(query)
+        state_in_query = find_state_in_query(query, query_lower)
         if state_in_query:
             current_state = state_in_query
 
@@ -103,9 +189,7 @@ async def get_state_info(
             continue
 
         # Fetch state data from MongoDB
-        state_doc = states_collection.find_one(
-            {"state_name": {"$regex": f"^{current_state}$", "$options": "i"}}
-        )
+        state_doc = _find_state_doc(states_collection, current_state)
 
         if not state_doc:
             response = "State not found in database. Please try another state."
@@ -138,19 +222,43 @@ async def get_state_info(
                 temperature=0.2,
             )
 
-            buffer = ""
-            for chunk in stream:
-                content = chunk.choices[0].delta.content
-                if content is not None:
-                    print(content, end="", flush=True)
-                    buffer += content
-
-            if buffer.strip():
-                for sentence in split_sentences(buffer):
-                    if sentence.strip():
-                        await speech_synthesizer.text_to_speech(sentence)
+            # Start synthesizing each sentence as soon as it is complete, while
+            # the rest of the answer is still streaming. Chunks are pulled in a
+            # worker thread so synthesis keeps running on the event loop.
+            tasks: List[asyncio.Task] = []
+            ordered: asyncio.Queue = asyncio.Queue()
+            player = asyncio.create_task(
+                _queue_in_order(speech_synthesizer, ordered)
+            )
 
-            speech_synthesizer.wait_for_playback_completion()
+            try:
+                chunks = iter(stream)
+                pending = ""
+                while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+                    content = chunk.choices[0].delta.content
+                    if content is None:
+                        continue
+                    print(content, end="", flush=True)
+                    pending += content
+                    # Everything but the last piece is a finished sentence; the
+                    # raw tail is kept so its trailing whitespace survives
+                    sentences = split_sentences(pending)
+                    if len(sentences) > 1:
+                        for sentence in sentences[:-1]:
+                            _speak_sentence(
+                                speech_synthesizer, sentence, tasks, ordered
+                            )
+                        pending = pending[pending.rfind(sentences[-1]) :]
+
+                _speak_sentence(speech_synthesizer, pending.strip(), tasks, ordered)
+                ordered.put_nowait(None)
+                await player
+            finally:
+                player.cancel()
+                for task in tasks:
+                    task.cancel()
+
+            await asyncio.to_thread(speech_synthesizer.wait_for_playback_completion)
             print("\n")
 
         except Exception as e:
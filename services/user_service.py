@@ -9,11 +9,31 @@ import logging
 from typing import Any, Dict, Optional
 
 from db import get_db
+from utils.data import ensure_sorted_desc
 
 logger = logging.getLogger(__name__)
 
 VALID_ROLES = ("admin", "client", "driver")
 
+# Fields read by get_user_info; skips the rest of the profile documents
+_DRIVER_PROJECTION = {
+    "_id": 0,
+    "first_name": 1,
+    "surname": 1,
+    "email": 1,
+    "phone": 1,
+    "order_ids": 1,
+    "order_status": 1,
+}
+_CLIENT_PROJECTION = {
+    "_id": 0,
+    "name": 1,
+    "email": 1,
+    "phone": 1,
+    "order_ids": 1,
+    "order_status": 1,
+}
+
 
 def verify_email(role: str, email: str) -> bool:
     """Verify that an email exists for a given role.
@@ -31,7 +51,7 @@ def verify_email(role: str, email: str) -> bool:
     try:
         db = get_db()
         collection = db.drivers if role == "driver" else db.clients
-        return collection.find_one({"email": email}) is not None
+        return collection.find_one({"email": email}, {"_id": 1}) is not None
     except Exception as e:
         logger.error("Error verifying email for %s: %s", role, e)
         return False
@@ -51,7 +71,7 @@ def get_user_info(role: str, email: str) -> Dict[str, Any]:
         db = get_db()
 
         if role == "driver":
-            user_data = db.drivers.find_one({"email": email})
+            user_data = db.drivers.find_one({"email": email}, _DRIVER_PROJECTION)
             if not user_data:
                 return {"error": "Driver not found"}
             return {
@@ -68,7 +88,7 @@ def get_user_info(role: str, email: str) -> Dict[str, Any]:
             }
 
         elif role == "client":
-            user_data = db.clients.find_one({"email": email})
+            user_data = db.clients.find_one({"email": email}, _CLIENT_PROJECTION)
             if not user_data:
                 return {"error": "Client not found"}
             return {
@@ -97,6 +117,9 @@ def get_user_info(role: str, email: str) -> Dict[str, Any]:
 def get_order_ids_for_user(user_data: Dict[str, Any]) -> list:
     """Extract sorted order IDs from user data.
 
+    The ETL pipeline stores ``order_ids`` newest-first, so the stored list
+    is returned directly; legacy unsorted lists are sorted in place.
+
     Args:
         user_data: User info dictionary from get_user_info().
 
@@ -104,7 +127,7 @@ def get_order_ids_for_user(user_data: Dict[str, Any]) -> list:
         List of order IDs sorted descending (newest first).
     """
     if "driver_info" in user_data:
-        return sorted(user_data["driver_info"]["order_ids"], reverse=True)
+        return ensure_sorted_desc(user_data["driver_info"]["order_ids"])
     elif "client_info" in user_data:
-        return sorted(user_data["client_info"]["order_ids"], reverse=True)
+        return ensure_sorted_desc(user_data["client_info"]["order_ids"])
     return []
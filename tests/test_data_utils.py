@@ -1,6 +1,11 @@
 """Unit tests for data utility functions."""
 
-from utils.data import remove_deleted_permits, remove_null_fields
+from utils.data import (
+    BoundedSet,
+    ensure_sorted_desc,
+    remove_deleted_permits,
+    remove_null_fields,
+)
 
 
 class TestRemoveNullFields:
@@ -34,6 +39,22 @@ class TestRemoveNullFields:
         result = remove_null_fields(data)
         assert result == {"zero": 0, "false": False}
 
+    def test_does_not_modify_input(self):
+        data = {"a": {"b": None}, "c": [1, None]}
+        remove_null_fields(data)
+        assert data == {"a": {"b": None}, "c": [1, None]}
+
+    def test_deep_nesting(self):
+        data = {}
+        node = data
+        for _ in range(5000):
+            node["child"] = {"none": None}
+            node = node["child"]
+        result = remove_null_fields(data)
+        for _ in range(5000):
+            result = result["child"]
+        assert result == {}
+
 
 class TestRemoveDeletedPermits:
     """Tests for remove_deleted_permits()."""
@@ -75,3 +96,53 @@ class TestRemoveDeletedPermits:
         }
         result = remove_deleted_permits(order)
         assert len(result["routeData"]) == 2
+
+
+class TestEnsureSortedDesc:
+    """Tests for ensure_sorted_desc()."""
+
+    def test_sorted_list_returned_as_is(self):
+        values = [5, 3, 1]
+        assert ensure_sorted_desc(values) is values
+        assert values == [5, 3, 1]
+
+    def test_unsorted_list_sorted_in_place(self):
+        values = [1, 5, 3]
+        assert ensure_sorted_desc(values) is values
+        assert values == [5, 3, 1]
+
+    def test_empty_list(self):
+        assert ensure_sorted_desc([]) == []
+
+
+class TestBoundedSet:
+    """Tests for BoundedSet."""
+
+    def test_membership(self):
+        keys = BoundedSet(maxsize=3)
+        keys.add("a")
+        assert "a" in keys
+        assert "b" not in keys
+
+    def test_evicts_oldest(self):
+        keys = BoundedSet(maxsize=2)
+        for key in ("a", "b", "c"):
+            keys.add(key)
+        assert list(keys) == ["b", "c"]
+
+    def test_readd_refreshes_key(self):
+        keys = BoundedSet(maxsize=2)
+        keys.add("a")
+        keys.add("b")
+        keys.add("a")
+        keys.add("c")
+        assert "a" in keys
+        assert "b" not in keys
+        assert len(keys) == 2
+
+    def test_discard(self):
+        keys = BoundedSet(maxsize=2)
+        keys.add("a")
+        keys.discard("a")
+        keys.discard("missing")
+        assert len(keys) == 0
@@ -0,0 +1,42 @@
+"""Unit tests for order context resolution."""
+
+from services.order_service import resolve_order_context
+
+DRIVER = {"driver_info": {"order_ids": [5001, 5003, 5002, 5004]}}
+
+
+def _resolve(query, current_order_id=None):
+    return resolve_order_context(query, current_order_id, DRIVER)
+
+
+class TestResolveOrderContext:
+    """Tests for position, ordinal, and direct order references."""
+
+    def test_latest_and_last(self):
+        assert _resolve("show my latest order")[:2] == (True, [5004])
+        assert _resolve("what about the last order")[:2] == (True, [5004])
+
+    def test_position_phrase(self):
+        assert _resolve("details of my second last order")[:2] == (True, [5003])
+
+    def test_ordinal(self):
+        switch, order_ids, explanation = _resolve("show the 3rd latest order")
+        assert (switch, order_ids) == (True, [5002])
+        assert "3rd latest" in explanation
+
+    def test_ordinal_out_of_range(self):
+        assert _resolve("show the 9th latest order")[:2] == (False, [])
+
+    def test_direct_id(self):
+        assert _resolve("tell me about #5003")[:2] == (True, [5003])
+        assert _resolve("order 5001 please")[:2] == (True, [5001])
+
+    def test_unknown_id_keeps_current_order(self):
+        assert _resolve("order 9999", current_order_id=5002)[:2] == (False, [5002])
+
+    def test_leftmost_position_wins(self):
+        assert _resolve("compare my second order with the latest")[:2] == (True, [5003])
+        assert _resolve("compare the latest with my second order")[:2] == (True, [5004])
+
+    def test_position_beats_direct_id(self):
+        assert _resolve("is order 5001 my latest")[:2] == (True, [5004])
@@ -1,6 +1,11 @@
 """Unit tests for query processor filters."""
 
+from datetime import datetime, timedelta
+
 from pipelines.query_processor import (
+    apply_filters,
+    build_status_index,
+    filter_by_date,
     filter_by_order_status,
     filter_by_state,
     restructure_results,
@@ -38,6 +43,43 @@ class TestFilterByOrderStatus:
         result = filter_by_order_status(data, "show all orders")
         assert len(result) == 2
 
+    def test_open_and_closed_keeps_order(self):
+        data = [
+            {"order_id": 1, "order_status": "Closed"},
+            {"order_id": 2, "order_status": "Open"},
+            {"order_id": 3, "order_status": "Pending"},
+            {"order_id": 4, "order_status": "Completed"},
+        ]
+        result = filter_by_order_status(data, "open and closed orders")
+        assert [r["order_id"] for r in result] == [1, 2, 4]
+
+    def test_uses_prebuilt_index(self):
+        data = [
+            {"order_id": 1, "order_status": "Open"},
+            {"order_id": 2, "order_status": "Completed"},
+        ]
+        index = build_status_index(data)
+        result = filter_by_order_status(data, "completed orders", index)
+        assert [r["order_id"] for r in result] == [2]
+
+
+class TestBuildStatusIndex:
+    """Tests for status bucketing."""
+
+    def test_groups_by_status(self):
+        data = [
+            {"order_id": 1, "order_status": "Open"},
+            {"order_id": 2, "order_status": "Closed"},
+            {"order_id": 3, "order_status": "completed"},
+            {"order_id": 4, "order_status": "Pending"},
+            {"order_id": 5},
+        ]
+        index = build_status_index(data)
+        assert [r["order_id"] for r in index["open"]] == [1]
+        assert [r["order_id"] for r in index["closed"]] == [2, 3]
+        assert [r["order_id"] for r in index["pending"]] == [4]
+        assert len(index) == 3
+
 
 class TestFilterByState:
     """Tests for state-based route filtering."""
@@ -98,3 +140,49 @@ class TestRestructureResults:
         assert "routeData" in result[0]
         assert len(result[0]["routeData"]) == 2
         assert result[0]["routeData"][0]["state_name"] == "Texas - 2024-06-16"
+
+
+class TestApplyFilters:
+    """Tests for the combined filter pipeline."""
+
+    @staticmethod
+    def _rows():
+        last_month = (datetime.today().replace(day=1) - timedelta(days=1)).replace(day=15)
+        older = last_month - timedelta(days=200)
+        rows = []
+        for order_id, (status, created, states) in enumerate(
+            [
+                ("Open", last_month, ["Texas - 1", "Arizona - 2"]),
+                ("Closed", older, ["Texas - 1"]),
+                ("Pending", last_month, ["Arizona - 1"]),
+                ("Completed", last_month, ["Texas - 3"]),
+                ("open", older, ["Arizona - 4", "Texas - 5"]),
+                ("Closed", last_month, ["Arizona - 2"]),
+            ],
+            start=1,
+        ):
+            rows.append(
+                {
+                    "order_id": order_id,
+                    "order_status": status,
+                    "order_created_date": created.strftime("%Y-%m-%d %H:%M:%S"),
+                    "state_name": states,
+                }
+            )
+        return rows
+
+    def test_matches_status_first_pipeline(self):
+        queries = [
+            "show all orders",
+            "open orders",
+            "closed orders in texas",
+            "open and completed orders from last month",
+            "completed orders in arizona last month",
+        ]
+        for query in queries:
+            rows = restructure_results(self._rows())
+            rows = filter_by_order_status(rows, query)
+            rows = filter_by_date(rows, query)
+            rows = filter_by_state(rows, query)
+            expected = append_status_counts(rows)
+            assert apply_filters(self._rows(), query) == expected, query
@@ -1,6 +1,12 @@
 """Unit tests for text utility functions."""
 
-from utils.text import clean_response, normalize_whitespace, split_sentences
+from utils.text import (
+    clean_response,
+    compile_keyword_pattern,
+    find_state_name,
+    normalize_whitespace,
+    split_sentences,
+)
 
 
 class TestSplitSentences:
@@ -29,6 +35,18 @@ class TestSplitSentences:
         assert len(result) >= 1
         assert "No punctuation here" in result[0]
 
+    def test_keeps_times_together(self):
+        result = split_sentences("Pickup at 9 a.m. or 10:30 tomorrow. Drop by noon.")
+        assert result == ["Pickup at 9 a.m. or 10:30 tomorrow.", "Drop by noon."]
+
+    def test_keeps_label_and_number_together(self):
+        result = split_sentences("Weight: 80000 lbs allowed. Note: escorts apply.")
+        assert result == ["Weight: 80000 lbs allowed.", "Note:", "escorts apply."]
+
+    def test_keeps_decimals_and_currency_together(self):
+        result = split_sentences("The permit costs $25.50 total. Escort needed.")
+        assert result == ["The permit costs $25.50 total.", "Escort needed."]
+
 
 class TestCleanResponse:
     """Tests for clean_response()."""
@@ -48,6 +66,37 @@ class TestCleanResponse:
         assert clean_response(text) == text
 
 
+class TestCompileKeywordPattern:
+    """Tests for compile_keyword_pattern()."""
+
+    def test_matches_substring(self):
+        pattern = compile_keyword_pattern(["go to orders", "show orders"])
+        assert pattern.search("please go to orders now")
+
+    def test_no_match(self):
+        pattern = compile_keyword_pattern(["go to orders"])
+        assert pattern.search("what is the weather") is None
+
+    def test_prefers_longest_keyword(self):
+        pattern = compile_keyword_pattern(["virginia", "west virginia"])
+        assert pattern.search("permits in west virginia").group(0) == "west virginia"
+
+    def test_escapes_special_characters(self):
+        pattern = compile_keyword_pattern(["what's new"])
+        assert pattern.search("hey what's new")
+        assert pattern.search("hey whatxs new") is None
+
+
+class TestFindStateName:
+    """Tests for find_state_name()."""
+
+    def test_returns_canonical_name(self):
+        assert find_state_name("permits in west virginia") == "West Virginia"
+
+    def test_no_state(self):
+        assert find_state_name("what is the weather") is None
+
+
 class TestNormalizeWhitespace:
     """Tests for normalize_whitespace()."""
 
@@ -1,11 +1,25 @@
 """Utility functions for HeavyHaul AI."""
 
-from utils.text import split_sentences, clean_response
-from utils.data import remove_null_fields, remove_deleted_permits
+from utils.text import (
+    split_sentences,
+    clean_response,
+    compile_keyword_pattern,
+    find_state_name,
+)
+from utils.data import (
+    BoundedSet,
+    ensure_sorted_desc,
+    remove_deleted_permits,
+    remove_null_fields,
+)
 
 __all__ = [
     "split_sentences",
     "clean_response",
+    "compile_keyword_pattern",
+    "find_state_name",
     "remove_null_fields",
     "remove_deleted_permits",
+    "ensure_sorted_desc",
+    "BoundedSet",
 ]
@@ -4,23 +4,73 @@ Data manipulation utilities for HeavyHaul AI.
 Functions for cleaning, filtering, and transforming order data structures.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+K = TypeVar("K", bound=Hashable)
 
 
 def remove_null_fields(data: Any) -> Any:
     """Recursively remove None values from nested data structures.
 
+    Walks the structure with an explicit stack rather than recursion, so
+    deeply nested payloads cannot hit the recursion limit. The input is
+    not modified; containers are copied as they are visited.
+
     Args:
         data: Input data (dict, list, or scalar).
 
     Returns:
         Data with None values removed.
     """
-    if isinstance(data, dict):
-        return {k: remove_null_fields(v) for k, v in data.items() if v is not None}
-    elif isinstance(data, list):
-        return [remove_null_fields(item) for item in data if item is not None]
-    return data
+    if not isinstance(data, (dict, list)):
+        return data
+
+    result: Union[Dict[Any, Any], List[Any]] = {} if isinstance(data, dict) else []
+    stack: List[Tuple[Any, Any]] = [(data, result)]
+    push = stack.append
+    while stack:
+        source, target = stack.pop()
+        # Separate dict and list loops keep type checks off the per-item path
+        if isinstance(source, dict):
+            for key, value in source.items():
+                if value is None:
+                    continue
+                if isinstance(value, dict):
+                    copy: Any = {}
+                    push((value, copy))
+                    value = copy
+                elif isinstance(value, list):
+                    copy = []
+                    push((value, copy))
+                    value = copy
+                target[key] = value
+        else:
+            append = target.append
+            for value in source:
+                if value is None:
+                    continue
+                if isinstance(value, dict):
+                    copy = {}
+                    push((value, copy))
+                    value = copy
+                elif isinstance(value, list):
+                    copy = []
+                    push((value, copy))
+                    value = copy
+                append(value)
+    return result
 
 
 def remove_deleted_permits(route_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -36,3 +86,56 @@ def remove_deleted_permits(route_data: List[Dict[str, Any]]) -> List[Dict[str, A
         route for route in route_data
         if route.get("permit_status") != "Delete"
     ]
+
+
+def ensure_sorted_desc(values: List[Any]) -> List[Any]:
+    """Return a list sorted descending, sorting in place only if needed.
+
+    Lists written by the ETL pipeline are already stored newest-first, so
+    the common case is a single linear check with no copy.
+
+    Args:
+        values: List to check; sorted in place if out of order.
+
+    Returns:
+        The same list, sorted descending.
+    """
+    if any(values[i] < values[i + 1] for i in range(len(values) - 1)):
+        values.sort(reverse=True)
+    return values
+
+
+class BoundedSet(Generic[K]):
+    """Set that evicts its least recently added keys beyond a size limit.
+
+    Re-adding an existing key marks it as most recent.
+
+    Args:
+        maxsize: Maximum number of keys to keep.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._keys: "OrderedDict[K, None]" = OrderedDict()
+
+    def add(self, key: K) -> None:
+        """Add a key, evicting the oldest key if the set is full."""
+        if key in self._keys:
+            self._keys.move_to_end(key)
+            return
+        self._keys[key] = None
+        if len(self._keys) > self.maxsize:
+            self._keys.popitem(last=False)
+
+    def discard(self, key: K) -> None:
+        """Remove a key if present."""
+        self._keys.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._keys)
@@ -6,7 +6,23 @@ used across speech synthesis and LLM response processing.
 """
 
 import re
-from typing import List
+from typing import Iterable, List, Optional, Pattern
+
+from config.constants import ORDER_SWITCH_KEYWORDS, STATES
+
+# Sentence terminators followed by whitespace or end of text. A period or
+# colon does not end a sentence after a number (decimals, times, currency),
+# a single-letter initial, or an a.m./p.m. marker, and a colon does not end
+# one when a number follows ("Weight: 80000").
+_SENTENCE_END_RE = re.compile(
+    r"(?:"
+    r"(?<!\d)(?<!\b[A-Za-z])(?<![AaPp]\.[Mm])"
+    r"(?<!\d[AaPp][Mm])(?<!\d\s[AaPp][Mm])"
+    r"(?:\.|:(?!\s*[$\d]))|[!?])(?=\s|$)"
+)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_ESCAPED_QUOTE_RE = re.compile(r'\\"')
 
 
 def split_sentences(text: str) -> List[str]:
@@ -22,45 +38,56 @@ def split_sentences(text: str) -> List[str]:
         A list of sentence strings.
     """
     result: List[str] = []
-    current = ""
-    i = 0
-
-    while i < len(text):
-        char = text[i]
-        current += char
-
-        if char in (".", ":"):
-            prev_char = text[i - 1] if i > 0 else ""
-            next_char = text[i + 1] if i < len(text) - 1 else ""
-
-            should_split = True
-
-            # Check for a.m. / p.m. patterns
-            text_around = text[max(0, i - 5) : min(len(text), i + 3)].lower()
-            if any(t in text_around for t in ("a.m", "p.m", "am.", "pm.")):
-                should_split = False
-            # Check for decimal numbers and currency
-            elif prev_char.isdigit() and (
-                next_char.isdigit()
-                or (i >= 2 and text[i - 2 : i].replace("$", "").isdigit())
-            ):
-                should_split = False
-            # Check for single letter/number abbreviations
-            elif prev_char.isalnum() and (i < 2 or text[i - 2].isspace()):
-                should_split = False
-
-            if should_split:
-                result.append(current.strip())
-                current = ""
-
-        i += 1
-
-    if current.strip():
-        result.append(current.strip())
+    start = 0
+
+    for match in _SENTENCE_END_RE.finditer(text):
+        sentence = text[start : match.end()].strip()
+        if sentence:
+            result.append(sentence)
+        start = match.end()
+
+    tail = text[start:].strip()
+    if tail:
+        result.append(tail)
 
     return result
 
 
+def compile_keyword_pattern(keywords: Iterable[str]) -> Pattern[str]:
+    """Compile keywords into one alternation regex for substring matching.
+
+    Longer keywords are tried first so overlapping phrases resolve to the
+    most specific match (e.g. "west virginia" before "virginia").
+
+    Args:
+        keywords: Lowercase keyword phrases.
+
+    Returns:
+        A compiled pattern whose ``search`` finds any of the keywords.
+    """
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile("|".join(re.escape(keyword) for keyword in ordered))
+
+
+# Matchers shared by the per-turn intent dispatch of the chat services
+ORDER_SWITCH_RE = compile_keyword_pattern(ORDER_SWITCH_KEYWORDS)
+STATES_BY_LOWER = {state.lower(): state for state in STATES}
+STATE_RE = compile_keyword_pattern(STATES_BY_LOWER)
+
+
+def find_state_name(query_lower: str) -> Optional[str]:
+    """Return the canonical name of the state mentioned in a query.
+
+    Args:
+        query_lower: The user's query text, lowercased.
+
+    Returns:
+        The matched state name, or None.
+    """
+    match = STATE_RE.search(query_lower)
+    return STATES_BY_LOWER[match.group(0)] if match else None
+
+
 def clean_response(response_text: str) -> str:
     """Clean up LLM response text by removing excessive whitespace.
 
@@ -84,7 +111,4 @@ def normalize_whitespace(text: str) -> str:
     Returns:
         Normalized text string.
     """
-    text = re.sub(r"\s+", " ", text)
-    text = text.replace("\n", " ")
-    text = text.replace('\\"', "")
-    return text.strip()
+    return _WHITESPACE_RE.sub(" ", _ESCAPED_QUOTE_RE.sub("", text)).strip()